@@ -4,9 +4,12 @@ from datetime import datetime
 import json
 import os
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from copenclaw.core.logging_config import append_to_file, get_audit_log_path
+from copenclaw.core.logging_config import append_to_file_deferred, get_audit_log_path, read_tail_lines
+
+# data_dirs already known to exist, so log_event skips the makedirs stat.
+_known_dirs: set[str] = set()
 
 def generate_request_id() -> str:
     """Generate a short unique request ID."""
@@ -18,7 +21,9 @@ def log_event(
     payload: Dict[str, Any],
     request_id: Optional[str] = None,
 ) -> None:
-    os.makedirs(data_dir, exist_ok=True)
+    if data_dir not in _known_dirs:
+        os.makedirs(data_dir, exist_ok=True)
+        _known_dirs.add(data_dir)
     path = os.path.join(data_dir, "audit.jsonl")
     record: Dict[str, Any] = {
         "ts": datetime.utcnow().isoformat() + "Z",
@@ -28,12 +33,33 @@ def log_event(
     if request_id:
         record["request_id"] = request_id
     line = json.dumps(record)
-    with open(path, "a", encoding="utf-8") as handle:
+    try:
+        handle = open(path, "a", encoding="utf-8")
+    except FileNotFoundError:
+        # The directory was removed since we last saw it.
+        os.makedirs(data_dir, exist_ok=True)
+        handle = open(path, "a", encoding="utf-8")
+    with handle:
         handle.write(line + "\n")
-    # Mirror to centralized audit log
+    # Mirror to centralized audit log.  The primary audit.jsonl above is
+    # written synchronously (readers expect it to be current); the mirror
+    # is only for operators, so it rides the batched background writer.
     try:
         central = get_audit_log_path()
         if central != path:
-            append_to_file(central, line)
+            append_to_file_deferred(central, line)
     except Exception:  # noqa: BLE001
         pass
+
+
+def read_recent_events(data_dir: str, limit: int = 100) -> List[Dict[str, Any]]:
+    """Return the last *limit* records from ``<data_dir>/audit.jsonl``.
+
+    Uses :func:`read_tail_lines`, so the cost tracks *limit* rather than
+    the file size.  A non-positive *limit* keeps the old
+    ``events[-limit:]`` slice semantics and reads the whole file.
+    """
+    lines = read_tail_lines(os.path.join(data_dir, "audit.jsonl"), limit)
+    if lines is None:
+        return []
+    return [json.loads(line) for line in lines if line.strip()]
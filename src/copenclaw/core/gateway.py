@@ -3,6 +3,7 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 import glob
+import hmac
 import logging
 from typing import Any, Optional
 import os
@@ -14,13 +15,13 @@ import threading
 import time
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi import FastAPI, Header, HTTPException, Request, Response
 from pydantic import BaseModel
 
 from copenclaw.core.audit import log_event
 from copenclaw.core.backup import create_snapshot
 from copenclaw.core.config import Settings
-from copenclaw.core.logging_config import setup_logging
+from copenclaw.core.logging_config import flush_deferred_appends, setup_logging
 from copenclaw.core.templates import orchestrator_template
 from copenclaw.core.pairing import PairingStore
 from copenclaw.core.policy import load_execution_policy
@@ -37,7 +38,7 @@ from copenclaw.integrations.teams_auth import validate_bearer_token
 from copenclaw.integrations.whatsapp import WhatsAppAdapter
 from copenclaw.integrations.signal import SignalAdapter
 from copenclaw.integrations.slack import SlackAdapter
-from copenclaw.mcp.protocol import MCPProtocolHandler
+from copenclaw.mcp.protocol import MCPProtocolHandler, encode_response
 
 logger = logging.getLogger("copenclaw.gateway")
 
@@ -368,7 +369,7 @@ def _build_boot_message(
         max_items = 6
         for task in visible_tasks[:max_items]:
             emoji = status_emoji.get(task.status, "•")
-            latest = task.timeline[-1].summary if task.timeline else ""
+            latest = task.latest_summary
             latest = _compact(latest, limit=90)
             suffix = f" — {latest}" if latest else ""
             lines.append(f"{emoji} {task.name} (`{task.task_id}`) [{task.status}]{suffix}")
@@ -1192,6 +1193,9 @@ def create_app() -> FastAPI:
         # Shutdown
         stop_event.set()
         worker_pool.stop_all()
+        task_manager.flush()
+        mcp_handler.flush_notifications()
+        mcp_handler.close_adapters()
         if tg_adapter:
             tg_adapter.stop_polling()
         if signal_adapter:
@@ -1852,6 +1856,11 @@ def create_app() -> FastAPI:
         # Graceful shutdown
         stop_event.set()
         worker_pool.stop_all()
+        # exec replaces the process without running atexit hooks.
+        task_manager.flush()
+        mcp_handler.flush_notifications()
+        # Last, since sending notifications can queue audit-mirror lines.
+        flush_deferred_appends()
         if tg_adapter:
             tg_adapter.stop_polling()
 
@@ -1895,7 +1904,6 @@ def create_app() -> FastAPI:
     @app.post("/control/restart")
     def control_restart() -> dict[str, str]:
         """Restart the COpenClaw process."""
-        import threading
         log_event(settings.data_dir, "app.restart", {"source": "http"})
         threading.Thread(target=_restart_app, args=("HTTP /control/restart",), daemon=True, name="app-restart").start()
         return {"status": "restarting"}
@@ -1912,9 +1920,9 @@ def create_app() -> FastAPI:
         if settings.mcp_token:
             token = request.headers.get("x-mcp-token")
             auth = request.headers.get("authorization", "")
-            if not token and auth.lower().startswith("bearer "):
-                token = auth.split(" ", 1)[1]
-            if token != settings.mcp_token:
+            if not token and auth[:7].lower() == "bearer ":
+                token = auth[7:]
+            if not hmac.compare_digest((token or "").encode("utf-8"), settings.mcp_token.encode("utf-8")):
                 raise HTTPException(status_code=401, detail="Invalid MCP token")
 
         # Extract per-task routing from query params
@@ -1923,6 +1931,6 @@ def create_app() -> FastAPI:
 
         body = await request.json()
         result = mcp_handler.handle_request(body, task_id=task_id, role=role)
-        return result
+        return Response(content=encode_response(result), media_type="application/json")
 
     return app
@@ -21,12 +21,15 @@ Log directory structure::
 """
 from __future__ import annotations
 
+import atexit
 import glob
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import shutil
+import threading
 import time
 from pathlib import Path
 from typing import Any, Optional
@@ -166,8 +169,13 @@ def log_mcp_call(
     duration_ms: float | None = None,
     tool_name: str | None = None,
     tool_args: dict[str, Any] | None = None,
+    result_json: str | None = None,
 ) -> None:
-    """Log an MCP JSON-RPC call to the dedicated MCP calls log."""
+    """Log an MCP JSON-RPC call to the dedicated MCP calls log.
+
+    Pass ``result_json`` when the caller already has ``result`` encoded,
+    so it isn't serialized a second time just to measure it.
+    """
     record: dict[str, Any] = {
         "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "method": method,
@@ -184,16 +192,21 @@ def log_mcp_call(
         record["role"] = role
     if duration_ms is not None:
         record["duration_ms"] = round(duration_ms, 1)
+    result_str: str | None = None
     if error:
         record["error"] = error[:5000]
     elif result is not None:
-        result_str = json.dumps(result, default=str)
+        result_str = result_json if result_json is not None else json.dumps(result, default=str)
         if len(result_str) > 10000:
             record["result_preview"] = result_str[:10000] + "..."
-        else:
-            record["result"] = result
+            result_str = None
     try:
-        mcp_call_logger.info(json.dumps(record, default=str))
+        line = json.dumps(record, default=str)
+        if result_str is not None:
+            # Splice in the already-encoded result (always the last key)
+            # rather than encoding it again as part of the record.
+            line = f'{line[:-1]}, "result": {result_str}}}'
+        mcp_call_logger.info(line)
     except Exception:  # noqa: BLE001
         pass
 
@@ -295,4 +308,123 @@ def append_to_file(path: str, line: str) -> None:
             f.write(f"{ts} {line}\n")
             f.flush()
     except Exception:  # noqa: BLE001
-        pass
\ No newline at end of file
+        pass
+
+
+# ── Deferred appends (hot-path logging) ──────────────────────
+#
+# Request handlers log several lines per call.  Rather than paying an
+# open/write/close on the request thread each time, lines are queued and
+# a single background writer appends them in batches, opening each file
+# once per batch.
+
+_APPEND_BATCH = 64
+_append_queue: "queue.SimpleQueue[tuple[str, str] | threading.Event]" = queue.SimpleQueue()
+_append_thread: Optional[threading.Thread] = None
+_append_thread_lock = threading.Lock()
+
+
+def append_to_file_deferred(path: str, line: str) -> None:
+    """Like :func:`append_to_file`, but the write happens on a background thread.
+
+    The timestamp is taken now, so lines keep their call-time ordering.
+    """
+    ts = time.strftime("%Y-%m-%dT%H:%M:%S")
+    _append_queue.put((path, f"{ts} {line}\n"))
+    if _append_thread is None:
+        _start_append_writer()
+
+
+def flush_deferred_appends(timeout: float = 5.0) -> None:
+    """Block until every line queued so far has been written."""
+    if _append_thread is None:
+        return
+    done = threading.Event()
+    _append_queue.put(done)
+    done.wait(timeout)
+
+
+def _start_append_writer() -> None:
+    global _append_thread
+    with _append_thread_lock:
+        if _append_thread is not None:
+            return
+        _append_thread = threading.Thread(
+            target=_append_writer_loop, daemon=True, name="log-append-writer",
+        )
+        _append_thread.start()
+        atexit.register(flush_deferred_appends)
+
+
+def _append_writer_loop() -> None:
+    while True:
+        batch = [_append_queue.get()]
+        while len(batch) < _APPEND_BATCH:
+            try:
+                batch.append(_append_queue.get_nowait())
+            except queue.Empty:
+                break
+        _write_append_batch(batch)
+
+
+def _write_append_batch(batch: list[tuple[str, str] | threading.Event]) -> None:
+    pending: dict[str, list[str]] = {}
+    for item in batch:
+        if isinstance(item, threading.Event):
+            # Flush marker: everything queued before it must hit disk first.
+            _write_pending(pending)
+            pending = {}
+            item.set()
+            continue
+        path, text = item
+        pending.setdefault(path, []).append(text)
+    _write_pending(pending)
+
+
+def _write_pending(pending: dict[str, list[str]]) -> None:
+    for path, texts in pending.items():
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("".join(texts))
+        except Exception:  # noqa: BLE001
+            pass
+
+
+# ── Tail reads ────────────────────────────────────────────────
+
+_TAIL_BLOCK = 64 * 1024
+
+
+def read_tail_lines(path: str, tail: int) -> list[str] | None:
+    """Return ``readlines()[-tail:]`` for a UTF-8 text file, or None if it is missing.
+
+    Reads backwards from the end in ``_TAIL_BLOCK`` chunks until more than
+    *tail* newlines are buffered, so the cost tracks the lines returned
+    rather than the file size.  Line endings are normalised as text-mode
+    reads do.  A non-positive *tail* reads the whole file, keeping the
+    slice semantics of ``readlines()[-tail:]``.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        if tail <= 0:
+            data = f.read()
+        else:
+            pos = os.fstat(f.fileno()).st_size
+            data = b""
+            # The first buffered line may be cut mid-line (or mid-character);
+            # reading one newline past *tail* means it is always sliced off.
+            while pos > 0 and data.count(b"\n") <= tail:
+                step = min(_TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+    text = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    parts = text.split("\n")
+    lines = [part + "\n" for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines[-tail:]
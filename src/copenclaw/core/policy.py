@@ -12,6 +12,7 @@ not the full command string. For example, allowing "git" permits
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
 import os
 import subprocess
@@ -117,19 +118,38 @@ class ExecutionPolicy:
         self.denied_commands.update(c.lower().strip() for c in commands if c.strip())
 
 def load_execution_policy() -> ExecutionPolicy:
-    allow_all_raw = os.getenv("copenclaw_ALLOW_ALL_COMMANDS", "true")
+    allow_all, allowed_set, denied_set = _parse_execution_policy(
+        os.getenv("copenclaw_ALLOW_ALL_COMMANDS", "true"),
+        os.getenv("copenclaw_ALLOWED_COMMANDS", ""),
+        os.getenv("copenclaw_DENIED_COMMANDS", ""),
+    )
+    # Fresh sets per policy: ExecutionPolicy.add_allowed/add_denied mutate them.
+    return ExecutionPolicy(
+        allowed_commands=set(allowed_set),
+        denied_commands=set(denied_set),
+        allow_all=allow_all,
+    )
+
+@lru_cache(maxsize=8)
+def _parse_execution_policy(
+    allow_all_raw: str, allowed: str, denied: str,
+) -> tuple[bool, frozenset[str], frozenset[str]]:
+    """Parse the execution-policy env vars.
+
+    Cached on their raw values, so the /exec path and each MCP handler
+    don't re-parse (and re-log) an unchanged configuration, while a
+    changed env still takes effect on the next load.
+    """
     allow_all = allow_all_raw.lower() in {"1", "true", "yes"}
-    allowed = os.getenv("copenclaw_ALLOWED_COMMANDS", "")
-    allowed_set = {c.strip().lower() for c in allowed.split(",") if c.strip()}
-    denied = os.getenv("copenclaw_DENIED_COMMANDS", "")
-    denied_set = {c.strip().lower() for c in denied.split(",") if c.strip()}
+    allowed_set = frozenset(c.strip().lower() for c in allowed.split(",") if c.strip())
+    denied_set = frozenset(c.strip().lower() for c in denied.split(",") if c.strip())
 
     logger.info(
         "Loaded execution policy: allow_all=%s (raw='%s'), allowed=%s, denied=%s",
-        allow_all, allow_all_raw, allowed_set or "(empty)", denied_set or "(empty)",
+        allow_all, allow_all_raw, set(allowed_set) or "(empty)", set(denied_set) or "(empty)",
     )
 
-    return ExecutionPolicy(allowed_commands=allowed_set, denied_commands=denied_set, allow_all=allow_all)
+    return allow_all, allowed_set, denied_set
 
 def run_command(command: str, policy: ExecutionPolicy, timeout: int | None = None, cwd: str | None = None) -> str:
     """Execute a shell command subject to the execution policy.
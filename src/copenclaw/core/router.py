@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import os
 import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -106,7 +107,6 @@ def handle_chat(
         reason = text[len("/restart"):].strip() or "User requested via /restart"
         log_event(data_dir, f"{req.channel}.restart", {"sender_id": req.sender_id, "reason": reason}, request_id=rid)
         if on_restart:
-            import threading
             threading.Thread(target=on_restart, args=(reason,), daemon=True, name="app-restart").start()
             return ChatResponse(text="🔄 Restarting COpenClaw… The app will be back online shortly.")
         return ChatResponse(text="Restart not available — no restart callback configured.")
@@ -504,7 +504,7 @@ def _cmd_tasks(tm: Optional[TaskManager]) -> ChatResponse:
     for t in all_tasks:
         emoji = {"proposed": "📋", "pending": "⏳", "running": "🔄", "paused": "⏸️", "needs_input": "❓"}.get(t.status, "•")
         age = _time_ago(t.created_at)
-        latest = t.timeline[-1].summary if t.timeline else ""
+        latest = t.latest_summary
         lines.append(f"{emoji} **{t.name}** (`{t.task_id}`)\n   Status: {t.status} | Created: {age}\n   Latest: {latest}")
     header = f"📋 **{len(all_tasks)} task(s):**\n"
     return ChatResponse(text=header + "\n\n".join(lines))
@@ -613,8 +613,8 @@ def _cmd_logs(tm: Optional[TaskManager], task_id: str) -> ChatResponse:
     task = tm.get(task_id)
     if not task:
         return ChatResponse(text=f"Task not found: `{task_id}`")
-    logs = tm.read_log(task_id, tail=50)
-    if not logs or logs == "(no logs)":
+    logs = tm.tail_log(task_id, tail=50)
+    if not logs:
         return ChatResponse(text=f"No logs yet for **{task.name}** (`{task_id}`)")
     # Truncate if too long for chat
     if len(logs) > 3500:
@@ -688,7 +688,6 @@ def _build_unauthorized_message(channel: str, sender_id: str) -> str:
 
 def _time_ago(dt) -> str:
     """Return a human-readable 'X ago' string."""
-    from datetime import datetime, timezone
     now = datetime.now(timezone.utc)
     # Make dt timezone-aware if it isn't
     if dt.tzinfo is None:
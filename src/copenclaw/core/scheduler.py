@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 import json
 import os
 from typing import Dict, Optional
@@ -9,6 +10,18 @@ import uuid
 
 from croniter import croniter
 
+
+@lru_cache(maxsize=256)
+def _cron_is_valid(expr: str) -> bool:
+    # Building a croniter parses the whole expression; the same handful of
+    # expressions get re-validated on every schedule call.
+    try:
+        croniter(expr)
+        return True
+    except (ValueError, KeyError):
+        return False
+
+
 @dataclass
 class ScheduledJob:
     job_id: str
@@ -105,11 +118,7 @@ class Scheduler:
     @staticmethod
     def validate_cron(expr: str) -> bool:
         """Check whether a cron expression is valid."""
-        try:
-            croniter(expr)
-            return True
-        except (ValueError, KeyError):
-            return False
+        return _cron_is_valid(expr)
 
     def schedule(
         self,
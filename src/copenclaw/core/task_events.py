@@ -12,11 +12,13 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
-from copenclaw.core.logging_config import append_to_file, get_worker_log_dir
+from copenclaw.core.logging_config import append_to_file_deferred, get_worker_log_dir
 
 logger = logging.getLogger("copenclaw.task_events")
 
@@ -64,13 +66,24 @@ class TaskEvent:
 class TaskEventLog:
     """Append-only event stream for a task, backed by a JSONL file.
 
+    The most recent ``RECENT_EVENTS`` events and the total count are also
+    kept in memory, so ``tail()``/``count()`` — polled by supervisors and
+    status tools — don't re-read the whole file.  The cache is seeded from
+    the file on first use and assumes this instance is the file's only
+    writer (the registry hands out one log per task).
+
     Thread-safe: uses file-level append (each write is a single line).
     """
 
+    RECENT_EVENTS = 512
+
     def __init__(self, task_dir: str, task_id: str = "") -> None:
         self.task_dir = task_dir
         self.task_id = task_id
         self._path = os.path.join(task_dir, "events.jsonl")
+        self._lock = threading.Lock()
+        self._recent: Optional[Deque[TaskEvent]] = None
+        self._count = 0
 
     @property
     def path(self) -> str:
@@ -95,25 +108,53 @@ class TaskEventLog:
             task_id=self.task_id,
         )
         line = json.dumps(event.to_dict(), default=str)
-        try:
-            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
-            with open(self._path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
-                f.flush()
-        except Exception as exc:  # noqa: BLE001
-            logger.error("Failed to write task event: %s", exc)
+        with self._lock:
+            self._ensure_recent()
+            try:
+                os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+                with open(self._path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                    f.flush()
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Failed to write task event: %s", exc)
+            self._recent.append(event)
+            self._count += 1
         # Mirror to centralized per-task log dir
         if self.task_id:
             try:
                 central_path = os.path.join(get_worker_log_dir(self.task_id), "events.jsonl")
                 if central_path != self._path:
-                    append_to_file(central_path, line)
+                    append_to_file_deferred(central_path, line)
             except Exception:  # noqa: BLE001
                 pass
         return event
 
+    def _ensure_recent(self) -> Deque[TaskEvent]:
+        """Seed the in-memory tail from disk on first use.  Caller holds ``_lock``."""
+        if self._recent is None:
+            recent: Deque[TaskEvent] = deque(maxlen=self.RECENT_EVENTS)
+            count = 0
+            if os.path.exists(self._path):
+                try:
+                    # Only the lines that survive in the tail get parsed.
+                    lines: Deque[str] = deque(maxlen=self.RECENT_EVENTS)
+                    with open(self._path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            if line.strip():
+                                lines.append(line)
+                                count += 1
+                    recent.extend(TaskEvent.from_dict(json.loads(line)) for line in lines)
+                except Exception as exc:  # noqa: BLE001
+                    logger.error("Failed to read task events: %s", exc)
+            self._recent = recent
+            self._count = count
+        return self._recent
+
     def tail(self, n: int = 50) -> List[TaskEvent]:
         """Read the last N events."""
+        if 0 < n <= self.RECENT_EVENTS:
+            with self._lock:
+                return list(self._ensure_recent())[-n:]
         if not os.path.exists(self._path):
             return []
         try:
@@ -142,13 +183,9 @@ class TaskEventLog:
 
     def count(self) -> int:
         """Count total events."""
-        if not os.path.exists(self._path):
-            return 0
-        try:
-            with open(self._path, "r", encoding="utf-8") as f:
-                return sum(1 for line in f if line.strip())
-        except Exception:  # noqa: BLE001
-            return 0
+        with self._lock:
+            self._ensure_recent()
+            return self._count
 
 
 class TaskEventRegistry:
@@ -7,14 +7,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import atexit
 import copy
+import heapq
 import json
 import os
 import threading
+import time
 from typing import Any, Dict, List, Optional
 import uuid
+import weakref
 import logging
 
+from copenclaw.core.logging_config import read_tail_lines
+
 logger = logging.getLogger("copenclaw.tasks")
 
 
@@ -22,6 +28,24 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Activity stamps are compared at minute scale (stuck-worker detection),
+# so back-to-back tool calls can share one clock reading.
+_COARSE_NOW_TTL_NS = 50_000_000
+_coarse_now_cache: tuple[int, datetime] = (0, _now())
+
+
+def _coarse_now() -> datetime:
+    """Like :func:`_now`, but reuses a reading taken within the last 50 ms."""
+    global _coarse_now_cache
+    mono = time.monotonic_ns()
+    stamp_mono, stamp = _coarse_now_cache
+    if mono - stamp_mono < _COARSE_NOW_TTL_NS:
+        return stamp
+    stamp = _now()
+    _coarse_now_cache = (mono, stamp)
+    return stamp
+
+
 # ── Data models ──────────────────────────────────────────────
 
 @dataclass
@@ -97,6 +121,9 @@ class TimelineEntry:
 # Valid task statuses
 TASK_STATUSES = {"proposed", "pending", "running", "paused", "needs_input", "completed", "failed", "cancelled"}
 TASK_TYPES = {"standard", "continuous_improvement"}
+# Statuses that still hold a task's name (duplicate-name guard, tasks_list).
+OPEN_TASK_STATUSES = frozenset({"proposed", "running", "paused", "needs_input", "pending", "needs_retry"})
+TERMINAL_TASK_STATUSES = frozenset({"completed", "failed", "cancelled"})
 
 _CI_DEFAULT_CONFIG: dict[str, Any] = {
     "objective": "",
@@ -232,6 +259,17 @@ class Task:
     ci_config: Dict[str, Any] = field(default_factory=dict)
     ci_state: Dict[str, Any] = field(default_factory=dict)
 
+    # Not persisted: count of unacknowledged inbox messages, kept in step
+    # by TaskManager.send_message / check_inbox under the manager's lock.
+    # -1 means "not counted yet".
+    _unread: int = field(default=-1, init=False, repr=False, compare=False)
+    # Not persisted: (datetime, isoformat) per timestamp field.  Callers
+    # assign updated_at directly, so entries are checked by identity.
+    _iso_cache: Dict[str, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Not persisted: (len(timeline), text) per concise_timeline limit.  The
+    # timeline is append-only, so an unchanged length means unchanged text.
+    _concise_cache: Dict[int, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict:
         return {
             "task_id": self.task_id,
@@ -239,8 +277,8 @@ class Task:
             "prompt": self.prompt,
             "status": self.status,
             "task_type": self.task_type,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_iso,
+            "updated_at": self.updated_iso,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "worker_session_id": self.worker_session_id,
             "supervisor_session_id": self.supervisor_session_id,
@@ -333,6 +371,40 @@ class Task:
             ci_state=d.get("ci_state", {}),
         )
 
+    @property
+    def unread_count(self) -> int:
+        """Number of inbox messages not yet acknowledged."""
+        unread = self._unread
+        if unread < 0:
+            # Only TaskManager stores the count, under its lock, so an
+            # unlocked reader here cannot race a concurrent send_message.
+            return sum(1 for m in self.inbox if not m.acknowledged)
+        return unread
+
+    def _iso(self, name: str, value: datetime) -> str:
+        hit = self._iso_cache.get(name)
+        if hit is not None and hit[0] is value:
+            return hit[1]
+        text = value.isoformat()
+        self._iso_cache[name] = (value, text)
+        return text
+
+    @property
+    def created_iso(self) -> str:
+        """``created_at.isoformat()``, formatted once."""
+        return self._iso("created_at", self.created_at)
+
+    @property
+    def updated_iso(self) -> str:
+        """``updated_at.isoformat()``, reformatted only after updated_at changes."""
+        return self._iso("updated_at", self.updated_at)
+
+    @property
+    def latest_summary(self) -> str:
+        """Summary of the most recent timeline entry ("" if none)."""
+        timeline = self.timeline
+        return timeline[-1].summary if timeline else ""
+
     def add_timeline(self, event: str, summary: str, detail: str = "") -> TimelineEntry:
         entry = TimelineEntry(ts=_now(), event=event, summary=summary, detail=detail)
         self.timeline.append(entry)
@@ -341,26 +413,50 @@ class Task:
 
     def concise_timeline(self, limit: int = 20) -> str:
         """Return a formatted concise timeline string."""
+        count = len(self.timeline)
+        hit = self._concise_cache.get(limit)
+        if hit is not None and hit[0] == count:
+            return hit[1]
         entries = self.timeline[-limit:]
         lines = []
         for e in entries:
             ts_str = e.ts.strftime("%H:%M:%S")
             lines.append(f"[{ts_str}] {e.event}: {e.summary}")
-        return "\n".join(lines) if lines else "(no timeline entries)"
+        text = "\n".join(lines) if lines else "(no timeline entries)"
+        self._concise_cache[limit] = (count, text)
+        return text
 
 
 # ── TaskManager ──────────────────────────────────────────────
 
+# Managers with a pending debounced save, flushed at interpreter exit.
+_DIRTY_MANAGERS: "weakref.WeakSet[TaskManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_dirty_managers() -> None:
+    for manager in list(_DIRTY_MANAGERS):
+        manager.flush()
+
+
 class TaskManager:
     """Manages the lifecycle of dispatched tasks."""
 
+    # Upper bound on how long a mark_dirty() change stays memory-only.
+    SAVE_DEBOUNCE_SECONDS = 0.5
+
     def __init__(self, data_dir: str, workspace_dir: str | None = None) -> None:
         self.data_dir = data_dir
         self.tasks_dir = os.path.join(workspace_dir, ".tasks") if workspace_dir else os.path.join(data_dir, ".tasks")
         self._tasks: Dict[str, Task] = {}
+        # name -> task_ids; names never change after creation, so this is
+        # only touched on create/load/clear.
+        self._ids_by_name: Dict[str, List[str]] = {}
         self._store_path = os.path.join(data_dir, "tasks.json")
         self._save_lock = threading.RLock()
         self._ci_locks: Dict[str, threading.Lock] = {}
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
         os.makedirs(self.tasks_dir, exist_ok=True)
         self._load()
 
@@ -376,10 +472,12 @@ class TaskManager:
                     task.task_type = "standard"
                 self._ensure_continuous_defaults(task)
                 self._tasks[task.task_id] = task
+                self._ids_by_name.setdefault(task.name, []).append(task.task_id)
         except Exception as exc:
             logger.error("Failed to load tasks: %s", exc)
 
     def _save(self) -> None:
+        self._dirty = False
         os.makedirs(os.path.dirname(self._store_path), exist_ok=True)
         payload = {"tasks": [t.to_dict() for t in self._tasks.values()]}
         tmp_path = f"{self._store_path}.tmp"
@@ -390,6 +488,43 @@ class TaskManager:
                 os.fsync(f.fileno())
             os.replace(tmp_path, self._store_path)
 
+    def mark_dirty(self) -> None:
+        """Schedule a save instead of writing tasks.json right away.
+
+        Use for high-frequency, low-stakes updates (e.g. worker activity
+        timestamps).  Repeated calls within ``SAVE_DEBOUNCE_SECONDS``
+        coalesce into a single write; any ``_save()`` in the meantime
+        picks the changes up as well.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                return
+            timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self._flush_from_timer)
+            timer.daemon = True
+            self._save_timer = timer
+            _DIRTY_MANAGERS.add(self)
+        timer.start()
+
+    def flush(self) -> None:
+        """Write any changes recorded with :meth:`mark_dirty` now."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self._save()
+
+    def _flush_from_timer(self) -> None:
+        with self._save_lock:
+            self._save_timer = None
+            if not self._dirty:
+                return
+            try:
+                self._save()
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Deferred task save failed: %s", exc)
+
     def _ci_lock(self, task_id: str) -> threading.Lock:
         with self._save_lock:
             lock = self._ci_locks.get(task_id)
@@ -617,7 +752,7 @@ class TaskManager:
 
     def _set_ci_terminal(self, task: Task, status: str, phase: str, reason: str) -> str:
         task.status = status
-        if status in ("completed", "failed", "cancelled"):
+        if status in TERMINAL_TASK_STATUSES:
             task.completed_at = _now()
         task.ci_state["phase"] = phase
         task.ci_state["stop_reason"] = reason
@@ -903,6 +1038,7 @@ class TaskManager:
         event = "proposed" if status == "proposed" else "created"
         task.add_timeline(event, f"Task {event}: {name}")
         self._tasks[task_id] = task
+        self._ids_by_name.setdefault(name, []).append(task_id)
         if task.task_type == "continuous_improvement":
             self._record_ci_checkpoint(task, reason="task_created")
         self._save()
@@ -918,6 +1054,27 @@ class TaskManager:
             tasks = [t for t in tasks if t.status == status]
         return tasks
 
+    def open_and_recent_tasks(self, recent: int = 10) -> tuple[List[Task], List[Task]]:
+        """Return (open tasks, the *recent* most recently updated closed tasks).
+
+        One pass over a snapshot of the task table; the closed tasks are
+        picked with a bounded heap rather than sorting the whole history.
+        """
+        open_tasks: List[Task] = []
+        closed: List[Task] = []
+        # list() snapshots the values so a concurrent create can't break iteration.
+        for t in list(self._tasks.values()):
+            (open_tasks if t.status in OPEN_TASK_STATUSES else closed).append(t)
+        return open_tasks, heapq.nlargest(recent, closed, key=lambda t: t.updated_at)
+
+    def find_open_by_name(self, name: str) -> Optional[Task]:
+        """Return a task called *name* whose status is still open, if any."""
+        for task_id in self._ids_by_name.get(name, ()):
+            task = self._tasks.get(task_id)
+            if task and task.status in OPEN_TASK_STATUSES:
+                return task
+        return None
+
     def active_tasks(self) -> List[Task]:
         """Return tasks that are currently running or paused."""
         return [t for t in self._tasks.values() if t.status in ("running", "paused", "needs_input", "pending")]
@@ -962,7 +1119,7 @@ class TaskManager:
         old = task.status
         task.status = status
         task.updated_at = _now()
-        if status in ("completed", "failed", "cancelled"):
+        if status in TERMINAL_TASK_STATUSES:
             task.completed_at = _now()
             # Clean up CI lock for terminal states to prevent memory leak
             if task.task_type == "continuous_improvement":
@@ -1023,6 +1180,7 @@ class TaskManager:
         for task_id in list(self._tasks.keys()):
             self._cleanup_ci_lock(task_id)
         self._tasks.clear()
+        self._ids_by_name.clear()
         self._save()
         return count
 
@@ -1177,7 +1335,10 @@ class TaskManager:
             from_tier=from_tier,
             content=content,
         )
-        task.inbox.append(msg)
+        with self._save_lock:
+            task.inbox.append(msg)
+            if task._unread >= 0:
+                task._unread += 1
         task.outbox.append(msg)  # Also in full history
 
         # Timeline
@@ -1216,11 +1377,19 @@ class TaskManager:
         if not task:
             return []
 
-        unread = [m for m in task.inbox if not m.acknowledged]
-        if acknowledge and unread:
-            for m in unread:
-                m.acknowledged = True
-            self._save()
+        # Same lock as send_message, so no message can land between the
+        # snapshot and the counter update.
+        with self._save_lock:
+            if task.unread_count == 0:
+                return []
+            unread = [m for m in task.inbox if not m.acknowledged]
+            if acknowledge and unread:
+                for m in unread:
+                    m.acknowledged = True
+                task._unread = 0
+                self._save()
+            else:
+                task._unread = len(unread)
         return unread
 
     # ── Log management ────────────────────────────────────────
@@ -1236,12 +1405,16 @@ class TaskManager:
 
     def read_log(self, task_id: str, tail: int = 200) -> str:
         """Read the last N lines of a task's log."""
+        logs = self.tail_log(task_id, tail)
+        return "(no logs)" if logs is None else logs
+
+    def tail_log(self, task_id: str, tail: int = 200) -> Optional[str]:
+        """Like :meth:`read_log`, but None (not a placeholder) when there is no log file."""
         task = self._tasks.get(task_id)
-        if not task or not task.log_file or not os.path.exists(task.log_file):
-            return "(no logs)"
-        with open(task.log_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        return "".join(lines[-tail:])
+        if not task or not task.log_file:
+            return None
+        lines = read_tail_lines(task.log_file, tail)
+        return None if lines is None else "".join(lines)
 
     def set_worker_session(self, task_id: str, session_id: str) -> None:
         task = self._tasks.get(task_id)
@@ -0,0 +1,50 @@
+"""Shared httpx client configuration for the chat channel adapters.
+
+Every adapter talks to a handful of fixed hosts, so each one keeps a
+long-lived pooled client instead of opening a fresh connection per
+request.  Pool sizing, retry policy and the user-agent live here so all
+adapters behave the same way.
+"""
+from __future__ import annotations
+
+import httpx
+
+from copenclaw import __version__
+
+USER_AGENT = f"copenclaw/{__version__}"
+
+LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+DEFAULT_TIMEOUT = httpx.Timeout(15.0)
+
+# One transparent retry on connect failures (e.g. a TCP reset on a stale
+# keep-alive connection) before the error reaches the adapter.
+_RETRIES = 1
+
+
+def make_client(
+    base_url: str = "",
+    headers: dict[str, str] | None = None,
+    *,
+    timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+    http2: bool = False,
+) -> httpx.Client:
+    """Build a pooled ``httpx.Client`` with the shared adapter settings.
+
+    Transports own their connection pool, so each client gets its own
+    transport built from the shared ``LIMITS``.
+    """
+    merged = {"User-Agent": USER_AGENT}
+    if headers:
+        merged.update(headers)
+    transport = httpx.HTTPTransport(retries=_RETRIES, limits=LIMITS, http2=http2)
+    return httpx.Client(
+        base_url=base_url,
+        headers=merged,
+        timeout=timeout,
+        transport=transport,
+    )
@@ -0,0 +1,9 @@
+"""Small helpers shared by the chat channel adapters."""
+from __future__ import annotations
+
+
+def split_text(text: str, max_len: int) -> list[str]:
+    """Split *text* into consecutive chunks of at most *max_len* characters."""
+    if len(text) <= max_len:
+        return [text]
+    return [text[i:i + max_len] for i in range(0, len(text), max_len)]
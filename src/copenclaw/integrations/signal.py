@@ -10,6 +10,8 @@ Required env vars:
 """
 from __future__ import annotations
 
+import base64
+import json
 import logging
 import os
 import threading
@@ -19,22 +21,24 @@ from typing import Any, Callable, Optional
 
 import httpx
 
+from copenclaw.integrations._http import make_client
+from copenclaw.integrations._util import split_text
+
 logger = logging.getLogger("copenclaw.signal")
 
 _MAX_TEXT_LENGTH = 4096
 _CHUNK_MARGIN = 200
+# Signal clients expire the typing indicator after ~15s, so re-sending it
+# more often than this is redundant.
+_TYPING_REFRESH_SECONDS = 10.0
 
-
-def _split_text(text: str, max_len: int) -> list[str]:
-    if len(text) <= max_len:
-        return [text]
-    chunks: list[str] = []
-    start = 0
-    while start < len(text):
-        end = min(start + max_len, len(text))
-        chunks.append(text[start:end])
-        start = end
-    return chunks
+_IMAGE_CONTENT_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
 
 
 @dataclass
@@ -43,9 +47,17 @@ class SignalAdapter:
     phone_number: str
     _polling_thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
     _stop_event: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _base: str = field(default="", init=False, repr=False)
+    _client: Optional[httpx.Client] = field(default=None, init=False, repr=False)
+    _last_typing: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._base = self.api_url.rstrip("/") if self.api_url else ""
 
-    def _base_url(self) -> str:
-        return self.api_url.rstrip("/")
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = make_client()
+        return self._client
 
     def _request(
         self,
@@ -56,10 +68,9 @@ class SignalAdapter:
         log_errors: bool = True,
         **kwargs: Any,
     ) -> httpx.Response | None:
-        url = f"{self._base_url()}/{path.lstrip('/')}"
+        url = f"{self._base}/{path.lstrip('/')}"
         try:
-            with httpx.Client(timeout=timeout) as client:
-                return client.request(method, url, **kwargs)
+            return self._get_client().request(method, url, timeout=timeout, **kwargs)
         except httpx.RequestError as exc:
             if log_errors:
                 logger.error(
@@ -92,7 +103,7 @@ class SignalAdapter:
         if not text:
             text = "(empty response)"
         max_len = max(1, _MAX_TEXT_LENGTH - _CHUNK_MARGIN)
-        chunks = _split_text(text, max_len)
+        chunks = split_text(text, max_len)
         for chunk in chunks:
             payload: dict[str, Any] = {
                 "message": chunk,
@@ -112,33 +123,40 @@ class SignalAdapter:
 
     def send_image(self, recipient: str, image_path: str, caption: str | None = None) -> None:
         """Send an image as a base64-encoded attachment."""
-        import base64
-
         if not os.path.isfile(image_path):
             logger.error("Signal sendImage failed: file not found %s", image_path)
             return
 
         with open(image_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
+            image_data = base64.b64encode(f.read())
 
         # Determine content type from extension
         ext = os.path.splitext(image_path)[1].lower()
-        content_type_map = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
-        }
-        content_type = content_type_map.get(ext, "application/octet-stream")
+        content_type = _IMAGE_CONTENT_TYPES.get(ext, "application/octet-stream")
 
-        payload: dict[str, Any] = {
+        # Splice the base64 bytes straight into the JSON body instead of
+        # decoding them to str only for json to copy them again.  Base64
+        # output never needs JSON escaping.
+        head = json.dumps({
             "message": caption or "",
             "number": self.phone_number,
             "recipients": [recipient],
-            "base64_attachments": [f"data:{content_type};base64,{image_data}"],
-        }
-        resp = self._request("POST", "v2/send", timeout=30.0, json=payload)
+        })
+        body = b"".join([
+            head[:-1].encode("utf-8"),
+            b', "base64_attachments": ["data:',
+            content_type.encode("ascii"),
+            b";base64,",
+            image_data,
+            b'"]}',
+        ])
+        resp = self._request(
+            "POST",
+            "v2/send",
+            timeout=30.0,
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
         if not resp:
             return
         if resp.status_code not in (200, 201):
@@ -149,7 +167,16 @@ class SignalAdapter:
             )
 
     def send_typing(self, recipient: str) -> None:
-        """Send a typing indicator (if supported by the API version)."""
+        """Send a typing indicator (if supported by the API version).
+
+        Skipped if one was already sent to *recipient* within the last
+        ``_TYPING_REFRESH_SECONDS`` (e.g. once per chunk of a long reply).
+        """
+        now = time.monotonic()
+        last = self._last_typing.get(recipient)
+        if last is not None and now - last < _TYPING_REFRESH_SECONDS:
+            return
+        self._last_typing[recipient] = now
         payload = {"recipient": recipient}
         self._request(
             "PUT",
@@ -215,11 +242,15 @@ class SignalAdapter:
                                 on_update(parsed)
                             except Exception as exc:  # noqa: BLE001
                                 logger.error("Error processing Signal message: %s", exc)
+                    # Poll again right away while messages are flowing;
+                    # otherwise idle briefly between polls.
+                    wait = 0.0 if envelopes else 2.0
                 except Exception as exc:  # noqa: BLE001
                     logger.error("Signal polling error: %s", exc)
-                    time.sleep(5)
-                # Small delay between polls
-                self._stop_event.wait(2.0)
+                    wait = 5.0  # back off on errors
+                # Waiting on the stop event (rather than sleeping) lets
+                # stop_polling() interrupt the back-off immediately.
+                self._stop_event.wait(wait)
 
         self._polling_thread = threading.Thread(
             target=_poll_loop, daemon=True, name="signal-poller"
@@ -236,3 +267,6 @@ class SignalAdapter:
 
     def stop(self) -> None:
         self.stop_polling()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
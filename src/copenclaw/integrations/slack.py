@@ -15,32 +15,30 @@ import hmac
 import logging
 import os
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import httpx
 
+from copenclaw.integrations._http import make_client
+from copenclaw.integrations._util import split_text
+
 logger = logging.getLogger("copenclaw.slack")
 
 _API_BASE = "https://slack.com/api"
 _MAX_TEXT_LENGTH = 4000
 _CHUNK_MARGIN = 200
 
-def _split_text(text: str, max_len: int) -> list[str]:
-    if len(text) <= max_len:
-        return [text]
-    chunks: list[str] = []
-    start = 0
-    while start < len(text):
-        end = min(start + max_len, len(text))
-        chunks.append(text[start:end])
-        start = end
-    return chunks
-
 @dataclass
 class SlackAdapter:
     bot_token: str
     signing_secret: str = ""
+    _client: Optional[httpx.Client] = field(default=None, init=False, repr=False)
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = make_client(headers={"Authorization": f"Bearer {self.bot_token}"})
+        return self._client
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -55,31 +53,31 @@ class SlackAdapter:
         if not text:
             text = "(empty response)"
         max_len = max(1, _MAX_TEXT_LENGTH - _CHUNK_MARGIN)
-        chunks = _split_text(text, max_len)
+        chunks = split_text(text, max_len)
         url = f"{_API_BASE}/chat.postMessage"
-        with httpx.Client(timeout=15.0) as client:
-            for chunk in chunks:
-                payload: dict[str, Any] = {
-                    "channel": channel,
-                    "text": chunk,
-                }
-                if thread_ts:
-                    payload["thread_ts"] = thread_ts
-                resp = client.post(url, json=payload, headers=self._headers())
-                if resp.status_code != 200:
-                    logger.error(
-                        "Slack chat.postMessage failed: %s %s",
-                        resp.status_code,
-                        resp.text[:500],
-                    )
-                    return
-                data = resp.json()
-                if not data.get("ok"):
-                    logger.error(
-                        "Slack chat.postMessage error: %s",
-                        data.get("error", "unknown"),
-                    )
-                    return
+        client = self._get_client()
+        for chunk in chunks:
+            payload: dict[str, Any] = {
+                "channel": channel,
+                "text": chunk,
+            }
+            if thread_ts:
+                payload["thread_ts"] = thread_ts
+            resp = client.post(url, json=payload, headers=self._headers(), timeout=15.0)
+            if resp.status_code != 200:
+                logger.error(
+                    "Slack chat.postMessage failed: %s %s",
+                    resp.status_code,
+                    resp.text[:500],
+                )
+                return
+            data = resp.json()
+            if not data.get("ok"):
+                logger.error(
+                    "Slack chat.postMessage error: %s",
+                    data.get("error", "unknown"),
+                )
+                return
 
     def send_image(self, channel: str, image_path: str, caption: str | None = None) -> None:
         """Upload and send an image to a Slack channel."""
@@ -87,31 +85,31 @@ class SlackAdapter:
             logger.error("Slack sendImage failed: file not found %s", image_path)
             return
         url = f"{_API_BASE}/files.uploadV2"
-        with httpx.Client(timeout=30.0) as client:
-            with open(image_path, "rb") as f:
-                resp = client.post(
-                    url,
-                    headers={"Authorization": f"Bearer {self.bot_token}"},
-                    data={
-                        "channel_id": channel,
-                        "initial_comment": caption or "",
-                        "filename": os.path.basename(image_path),
-                    },
-                    files={"file": (os.path.basename(image_path), f)},
+        client = self._get_client()
+        with open(image_path, "rb") as f:
+            resp = client.post(
+                url,
+                data={
+                    "channel_id": channel,
+                    "initial_comment": caption or "",
+                    "filename": os.path.basename(image_path),
+                },
+                files={"file": (os.path.basename(image_path), f)},
+                timeout=30.0,
+            )
+            if resp.status_code != 200:
+                logger.error(
+                    "Slack files.uploadV2 failed: %s %s",
+                    resp.status_code,
+                    resp.text[:500],
+                )
+                return
+            data = resp.json()
+            if not data.get("ok"):
+                logger.error(
+                    "Slack files.uploadV2 error: %s",
+                    data.get("error", "unknown"),
                 )
-                if resp.status_code != 200:
-                    logger.error(
-                        "Slack files.uploadV2 failed: %s %s",
-                        resp.status_code,
-                        resp.text[:500],
-                    )
-                    return
-                data = resp.json()
-                if not data.get("ok"):
-                    logger.error(
-                        "Slack files.uploadV2 error: %s",
-                        data.get("error", "unknown"),
-                    )
 
     def send_typing(self, channel: str) -> None:
         """Indicate typing in a channel (ephemeral, best-effort)."""
@@ -188,23 +186,26 @@ class SlackAdapter:
     def open_dm(self, user_id: str) -> str | None:
         """Open a DM channel with a user. Returns the channel ID."""
         url = f"{_API_BASE}/conversations.open"
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.post(
-                url,
-                json={"users": user_id},
-                headers=self._headers(),
-            )
-            if resp.status_code != 200:
-                return None
-            data = resp.json()
-            if not data.get("ok"):
-                return None
-            return data.get("channel", {}).get("id")
+        client = self._get_client()
+        resp = client.post(
+            url,
+            json={"users": user_id},
+            headers=self._headers(),
+            timeout=10.0,
+        )
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+        if not data.get("ok"):
+            return None
+        return data.get("channel", {}).get("id")
 
-    # ── Lifecycle stubs ──────────────────────────────────
+    # ── Lifecycle ─────────────────────────────────────────
 
     def start(self) -> None:
         return None
 
     def stop(self) -> None:
-        return None
\ No newline at end of file
+        if self._client is not None:
+            self._client.close()
+            self._client = None
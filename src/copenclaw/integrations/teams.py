@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
 import httpx
 
+from copenclaw.integrations._http import make_client
+
 
 _BOTFRAMEWORK_SCOPE = "https://api.botframework.com/.default"
+# Fetch a new token this many seconds before the current one expires.
+_TOKEN_REFRESH_MARGIN = 300.0
 
 
 def _token_url(tenant_id: str) -> str:
@@ -16,30 +23,47 @@ class TeamsAdapter:
     app_id: str
     app_password: str
     tenant_id: str
+    _client: Optional[httpx.Client] = field(default=None, init=False, repr=False)
+    _token: str = field(default="", init=False, repr=False)
+    _token_expires_at: float = field(default=0.0, init=False, repr=False)
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = make_client()
+        return self._client
 
     def _get_access_token(self) -> str:
+        """Return a Bot Framework token, reusing it until shortly before it expires."""
+        if self._token and time.monotonic() < self._token_expires_at:
+            return self._token
         data = {
             "grant_type": "client_credentials",
             "client_id": self.app_id,
             "client_secret": self.app_password,
             "scope": _BOTFRAMEWORK_SCOPE,
         }
-        with httpx.Client(timeout=15.0) as client:
-            resp = client.post(_token_url(self.tenant_id), data=data)
-            resp.raise_for_status()
-            return resp.json()["access_token"]
+        client = self._get_client()
+        resp = client.post(_token_url(self.tenant_id), data=data, timeout=15.0)
+        resp.raise_for_status()
+        body = resp.json()
+        self._token = body["access_token"]
+        expires_in = float(body.get("expires_in", 0) or 0)
+        self._token_expires_at = time.monotonic() + expires_in - _TOKEN_REFRESH_MARGIN
+        return self._token
 
     def send_message(self, service_url: str, conversation_id: str, text: str) -> None:
         token = self._get_access_token()
         url = f"{service_url.rstrip('/')}/v3/conversations/{conversation_id}/activities"
         payload = {"type": "message", "text": text}
         headers = {"Authorization": f"Bearer {token}"}
-        with httpx.Client(timeout=15.0) as client:
-            resp = client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
+        client = self._get_client()
+        resp = client.post(url, json=payload, headers=headers, timeout=15.0)
+        resp.raise_for_status()
 
     def start(self) -> None:
         return None
 
     def stop(self) -> None:
-        return None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import json
 import logging
 from pathlib import Path
 import re
 import struct
-from typing import Any
+from typing import Any, BinaryIO, Callable
 from urllib.parse import urlparse
 import zipfile
 import zlib
 
 import httpx
 
+from copenclaw.integrations._http import make_client
+
 logger = logging.getLogger("copenclaw.teams_provision")
 
 _GRAPH_SCOPE = "https://graph.microsoft.com/.default"
@@ -59,20 +63,20 @@ def _token_url(tenant_id: str) -> str:
 
 
 def _request(
+    client: httpx.Client,
     method: str,
     url: str,
     *,
     token: str | None = None,
     json_body: dict[str, Any] | None = None,
-    content: bytes | None = None,
+    content: bytes | BinaryIO | None = None,
 ) -> dict[str, Any]:
     headers = {"Accept": "application/json"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
     if content is not None:
         headers["Content-Type"] = "application/zip"
-    with httpx.Client(timeout=30.0) as client:
-        resp = client.request(method, url, json=json_body, content=content, headers=headers)
+    resp = client.request(method, url, json=json_body, content=content, headers=headers)
     if resp.status_code >= 400:
         detail = resp.text[:800]
         raise TeamsProvisioningError(f"{method} {url} failed ({resp.status_code}): {detail}")
@@ -84,36 +88,57 @@ def _request(
         return {"raw": resp.text}
 
 
-def _get_token(tenant_id: str, client_id: str, client_secret: str, scope: str) -> str:
+def _get_token(client: httpx.Client, tenant_id: str, client_id: str, client_secret: str, scope: str) -> str:
     data = {
         "grant_type": "client_credentials",
         "client_id": client_id,
         "client_secret": client_secret,
         "scope": scope,
     }
-    with httpx.Client(timeout=20.0) as client:
-        resp = client.post(_token_url(tenant_id), data=data)
+    resp = client.post(_token_url(tenant_id), data=data, timeout=20.0)
     if resp.status_code >= 400:
         raise TeamsProvisioningError(f"Token request failed ({resp.status_code}): {resp.text[:500]}")
     return resp.json().get("access_token", "")
 
 
+def _run_parallel(*calls: Callable[[], Any]) -> list[Any]:
+    """Run independent read-only calls concurrently and return their results in order.
+
+    The first exception raised by any call propagates once all calls finish,
+    so never use this for calls that create resources.
+    """
+    with ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix="teams-provision") as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
 def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
     length = struct.pack(">I", len(data))
-    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
-    return length + chunk_type + data + struct.pack(">I", crc)
+    # Feed the CRC incrementally rather than hashing chunk_type + data,
+    # which would copy the whole payload first.
+    crc = zlib.crc32(data, zlib.crc32(chunk_type))
+    return b"".join([length, chunk_type, data, struct.pack(">I", crc)])
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_IEND = _png_chunk(b"IEND", b"")
 
 
+# The app icons never change, so each one is rendered once per process.
+@lru_cache(maxsize=4)
 def _solid_png(width: int, height: int, rgba: tuple[int, int, int, int]) -> bytes:
-    row = bytes([0]) + bytes(rgba) * width
-    raw = row * height
-    compressed = zlib.compress(raw)
+    # Each scanline is a filter byte (0 = none) followed by the pixels.
+    # bytes repetition fills the buffer in C; no per-pixel Python work.
+    raw = (b"\x00" + bytes(rgba) * width) * height
+    # Solid-colour input compresses to well under 1 KB even at level 1, so
+    # the default level 6's longer match search buys nothing useful.
+    compressed = zlib.compress(raw, 1)
     ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
     return b"".join([
-        b"\x89PNG\r\n\x1a\n",
+        _PNG_SIGNATURE,
         _png_chunk(b"IHDR", ihdr),
         _png_chunk(b"IDAT", compressed),
-        _png_chunk(b"IEND", b""),
+        _PNG_IEND,
     ])
 
 
@@ -129,22 +154,22 @@ def _extract_host(endpoint: str) -> str:
     return parsed.hostname
 
 
-def _ensure_resource_group(config: TeamsProvisioningConfig, token: str) -> None:
+def _ensure_resource_group(client: httpx.Client, config: TeamsProvisioningConfig, token: str) -> None:
     if not config.create_resource_group:
         return
     url = (
         f"{_ARM_BASE}/subscriptions/{config.subscription_id}/resourcegroups/"
         f"{config.resource_group}?api-version=2021-04-01"
     )
-    _request("PUT", url, token=token, json_body={"location": config.resource_group_location})
+    _request(client, "PUT", url, token=token, json_body={"location": config.resource_group_location})
 
 
-def _create_app_registration(config: TeamsProvisioningConfig, token: str) -> tuple[str, str]:
+def _create_app_registration(client: httpx.Client, config: TeamsProvisioningConfig, token: str) -> tuple[str, str]:
     payload = {
         "displayName": config.bot_name,
         "signInAudience": "AzureADMyOrg",
     }
-    data = _request("POST", f"{_GRAPH_BASE}/applications", token=token, json_body=payload)
+    data = _request(client, "POST", f"{_GRAPH_BASE}/applications", token=token, json_body=payload)
     app_id = data.get("appId")
     obj_id = data.get("id")
     if not app_id or not obj_id:
@@ -152,7 +177,7 @@ def _create_app_registration(config: TeamsProvisioningConfig, token: str) -> tup
     return app_id, obj_id
 
 
-def _add_app_password(app_object_id: str, token: str) -> str:
+def _add_app_password(client: httpx.Client, app_object_id: str, token: str) -> str:
     expires = datetime.now(timezone.utc) + timedelta(days=365 * 2)
     payload = {
         "passwordCredential": {
@@ -161,6 +186,7 @@ def _add_app_password(app_object_id: str, token: str) -> str:
         }
     }
     data = _request(
+        client,
         "POST",
         f"{_GRAPH_BASE}/applications/{app_object_id}/addPassword",
         token=token,
@@ -172,10 +198,10 @@ def _add_app_password(app_object_id: str, token: str) -> str:
     return secret
 
 
-def _create_service_principal(app_id: str, token: str) -> None:
+def _create_service_principal(client: httpx.Client, app_id: str, token: str) -> None:
     payload = {"appId": app_id}
     try:
-        _request("POST", f"{_GRAPH_BASE}/servicePrincipals", token=token, json_body=payload)
+        _request(client, "POST", f"{_GRAPH_BASE}/servicePrincipals", token=token, json_body=payload)
     except TeamsProvisioningError as exc:
         if "already exists" in str(exc).lower():
             return
@@ -183,6 +209,7 @@ def _create_service_principal(app_id: str, token: str) -> None:
 
 
 def _create_bot_registration(
+    client: httpx.Client,
     config: TeamsProvisioningConfig,
     token: str,
     app_id: str,
@@ -202,11 +229,11 @@ def _create_bot_registration(
             "description": "COpenClaw Teams bot",
         },
     }
-    data = _request("PUT", url, token=token, json_body=payload)
+    data = _request(client, "PUT", url, token=token, json_body=payload)
     return data.get("id", "")
 
 
-def _enable_teams_channel(config: TeamsProvisioningConfig, token: str) -> None:
+def _enable_teams_channel(client: httpx.Client, config: TeamsProvisioningConfig, token: str) -> None:
     url = (
         f"{_ARM_BASE}/subscriptions/{config.subscription_id}/resourceGroups/"
         f"{config.resource_group}/providers/Microsoft.BotService/botServices/"
@@ -220,7 +247,7 @@ def _enable_teams_channel(config: TeamsProvisioningConfig, token: str) -> None:
             "enableMessaging": True,
         },
     }
-    _request("PUT", url, token=token, json_body=payload)
+    _request(client, "PUT", url, token=token, json_body=payload)
 
 
 def _create_app_package(config: TeamsProvisioningConfig, app_id: str) -> Path:
@@ -228,8 +255,6 @@ def _create_app_package(config: TeamsProvisioningConfig, app_id: str) -> Path:
     package_dir = config.package_dir
     package_dir.mkdir(parents=True, exist_ok=True)
     safe_name = _safe_package_name(config.bot_name)
-    work_dir = package_dir / f"{safe_name}-teams-app"
-    work_dir.mkdir(parents=True, exist_ok=True)
 
     manifest = {
         "$schema": "https://developer.microsoft.com/en-us/json-schemas/teams/v1.16/MicrosoftTeams.schema.json",
@@ -261,53 +286,68 @@ def _create_app_package(config: TeamsProvisioningConfig, app_id: str) -> Path:
         "validDomains": [host],
     }
 
-    (work_dir / "manifest.json").write_text(
-        json.dumps(manifest, indent=2),
-        encoding="utf-8",
-    )
+    # Everything is already in memory, so write the archive members directly
+    # instead of staging them as loose files first.
+    manifest_json = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
     color_png = _solid_png(192, 192, (74, 58, 255, 255))
     outline_png = _solid_png(32, 32, (16, 16, 16, 255))
-    (work_dir / "color.png").write_bytes(color_png)
-    (work_dir / "outline.png").write_bytes(outline_png)
 
     zip_path = package_dir / f"{safe_name}-teams-app.zip"
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.write(work_dir / "manifest.json", arcname="manifest.json")
-        zf.write(work_dir / "color.png", arcname="color.png")
-        zf.write(work_dir / "outline.png", arcname="outline.png")
+    # The PNGs are already deflated internally, so store them as-is and
+    # only compress the manifest.
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("manifest.json", manifest_json, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("color.png", color_png)
+        zf.writestr("outline.png", outline_png)
     return zip_path
 
 
 def provision_teams_bot(config: TeamsProvisioningConfig) -> TeamsProvisioningResult:
-    graph_token = _get_token(config.tenant_id, config.admin_client_id, config.admin_client_secret, _GRAPH_SCOPE)
-    arm_token = _get_token(config.tenant_id, config.admin_client_id, config.admin_client_secret, _ARM_SCOPE)
-
-    _ensure_resource_group(config, arm_token)
-    app_id, app_object_id = _create_app_registration(config, graph_token)
-    app_secret = _add_app_password(app_object_id, graph_token)
-    _create_service_principal(app_id, graph_token)
-    bot_resource_id = _create_bot_registration(config, arm_token, app_id)
-
-    teams_channel_enabled = True
-    teams_channel_error = None
-    try:
-        _enable_teams_channel(config, arm_token)
-    except TeamsProvisioningError as exc:
-        teams_channel_enabled = False
-        teams_channel_error = str(exc)
-        logger.warning("Teams channel enable failed: %s", exc)
-
-    app_package = _create_app_package(config, app_id)
-
-    published = False
-    if config.publish:
-        _request(
-            "POST",
-            f"{_GRAPH_BASE}/appCatalogs/teamsApps",
-            token=graph_token,
-            content=app_package.read_bytes(),
+    # One pooled client for the whole flow so the Graph/ARM connections
+    # (and their TLS sessions) are reused across the provisioning calls.
+    # The two token fetches are independent and side-effect free, so they
+    # run concurrently.  The create calls stay sequential and fail-fast:
+    # a failure must not leave other resources half-provisioned, and the
+    # bot registration needs the service principal to exist first.
+    with make_client(timeout=30.0) as client:
+        graph_token, arm_token = _run_parallel(
+            lambda: _get_token(
+                client, config.tenant_id, config.admin_client_id, config.admin_client_secret, _GRAPH_SCOPE
+            ),
+            lambda: _get_token(
+                client, config.tenant_id, config.admin_client_id, config.admin_client_secret, _ARM_SCOPE
+            ),
         )
-        published = True
+
+        _ensure_resource_group(client, config, arm_token)
+        app_id, app_object_id = _create_app_registration(client, config, graph_token)
+        app_secret = _add_app_password(client, app_object_id, graph_token)
+        _create_service_principal(client, app_id, graph_token)
+        bot_resource_id = _create_bot_registration(client, config, arm_token, app_id)
+
+        teams_channel_enabled = True
+        teams_channel_error = None
+        try:
+            _enable_teams_channel(client, config, arm_token)
+        except TeamsProvisioningError as exc:
+            teams_channel_enabled = False
+            teams_channel_error = str(exc)
+            logger.warning("Teams channel enable failed: %s", exc)
+
+        app_package = _create_app_package(config, app_id)
+
+        published = False
+        if config.publish:
+            # Stream the package from disk rather than reading it into memory.
+            with app_package.open("rb") as package:
+                _request(
+                    client,
+                    "POST",
+                    f"{_GRAPH_BASE}/appCatalogs/teamsApps",
+                    token=graph_token,
+                    content=package,
+                )
+            published = True
 
     return TeamsProvisioningResult(
         app_id=app_id,
@@ -5,10 +5,13 @@ import os
 import time
 import threading
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
+from typing import Any, BinaryIO, Callable, Optional
 
 import httpx
 
+from copenclaw.integrations._http import make_client
+from copenclaw.integrations._util import split_text
+
 logger = logging.getLogger("copenclaw.telegram")
 
 # Telegram API limit for a single message
@@ -16,44 +19,54 @@ _MAX_TEXT_LENGTH = 4096
 _CHUNK_MARGIN = 200
 
 
-def _split_text(text: str, max_len: int) -> list[str]:
-    if len(text) <= max_len:
-        return [text]
-    chunks: list[str] = []
-    start = 0
-    while start < len(text):
-        end = min(start + max_len, len(text))
-        chunks.append(text[start:end])
-        start = end
-    return chunks
-
+def _open_unique(path: str) -> tuple[str, BinaryIO]:
+    """Create and open *path*, or the first free ``name-N.ext`` variant.
 
-def _unique_path(path: str) -> str:
-    if not os.path.exists(path):
-        return path
+    ``O_CREAT | O_EXCL`` claims the name atomically in one syscall per
+    attempt, so concurrent downloads can never pick the same file.
+    """
     base, ext = os.path.splitext(path)
-    for idx in range(1, 1000):
-        candidate = f"{base}-{idx}{ext}"
-        if not os.path.exists(candidate):
-            return candidate
-    return f"{base}-{int(time.time())}{ext}"
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    for idx in range(1000):
+        candidate = f"{base}-{idx}{ext}" if idx else path
+        try:
+            fd = os.open(candidate, flags, 0o644)
+        except FileExistsError:
+            continue
+        return candidate, os.fdopen(fd, "wb")
+    candidate = f"{base}-{int(time.time())}{ext}"
+    return candidate, open(candidate, "wb")
 
 @dataclass
 class TelegramAdapter:
     token: str
     _polling_thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
     _stop_event: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _client: Optional[httpx.Client] = field(default=None, init=False, repr=False)
+    _base: str = field(default="", init=False, repr=False)
+    _file_base: str = field(default="", init=False, repr=False)
 
-    def _base_url(self) -> str:
-        return f"https://api.telegram.org/bot{self.token}"
+    def __post_init__(self) -> None:
+        self._base = f"https://api.telegram.org/bot{self.token}"
+        self._file_base = f"https://api.telegram.org/file/bot{self.token}"
+
+    def _get_client(self) -> httpx.Client:
+        """Return the adapter's pooled client, creating it on first use.
+
+        Reusing one client keeps the TLS connection to api.telegram.org
+        alive across sends, typing indicators and long-polls.
+        """
+        if self._client is None:
+            self._client = make_client()
+        return self._client
 
     def send_typing(self, chat_id: int) -> None:
         """Send 'typing...' chat action indicator."""
-        url = f"{self._base_url()}/sendChatAction"
+        url = f"{self._base}/sendChatAction"
         payload = {"chat_id": chat_id, "action": "typing"}
         try:
-            with httpx.Client(timeout=5.0) as client:
-                client.post(url, json=payload)
+            client = self._get_client()
+            client.post(url, json=payload, timeout=5.0)
         except Exception as exc:  # noqa: BLE001
             logger.debug("sendChatAction failed (non-critical): %s", exc)
 
@@ -80,57 +93,57 @@ class TelegramAdapter:
     def send_message(self, chat_id: int, text: str) -> None:
         if not text:
             text = "(empty response)"
-        url = f"{self._base_url()}/sendMessage"
+        url = f"{self._base}/sendMessage"
         max_len = max(1, _MAX_TEXT_LENGTH - _CHUNK_MARGIN)
-        chunks = _split_text(text, max_len)
-        with httpx.Client(timeout=15.0) as client:
-            for chunk in chunks:
-                payload = {"chat_id": chat_id, "text": chunk}
-                resp = client.post(url, json=payload)
-                if resp.status_code != 200:
-                    logger.error(
-                        "Telegram sendMessage failed: %s %s",
-                        resp.status_code,
-                        resp.text[:500],
-                    )
-                    return  # Don't raise — callers handle gracefully
+        chunks = split_text(text, max_len)
+        client = self._get_client()
+        for chunk in chunks:
+            payload = {"chat_id": chat_id, "text": chunk}
+            resp = client.post(url, json=payload, timeout=15.0)
+            if resp.status_code != 200:
+                logger.error(
+                    "Telegram sendMessage failed: %s %s",
+                    resp.status_code,
+                    resp.text[:500],
+                )
+                return  # Don't raise — callers handle gracefully
 
     def send_photo(self, chat_id: int, photo_path: str, caption: str | None = None) -> None:
         if not os.path.isfile(photo_path):
             logger.error("Telegram sendPhoto failed: file not found %s", photo_path)
             return
-        url = f"{self._base_url()}/sendPhoto"
+        url = f"{self._base}/sendPhoto"
         payload: dict[str, Any] = {"chat_id": chat_id}
         if caption:
             payload["caption"] = caption
-        with httpx.Client(timeout=30.0) as client:
-            with open(photo_path, "rb") as handle:
-                files = {"photo": (os.path.basename(photo_path), handle)}
-                resp = client.post(url, data=payload, files=files)
-                if resp.status_code != 200:
-                    logger.error(
-                        "Telegram sendPhoto failed: %s %s",
-                        resp.status_code,
-                        resp.text[:500],
-                    )
+        client = self._get_client()
+        with open(photo_path, "rb") as handle:
+            files = {"photo": (os.path.basename(photo_path), handle)}
+            resp = client.post(url, data=payload, files=files, timeout=30.0)
+            if resp.status_code != 200:
+                logger.error(
+                    "Telegram sendPhoto failed: %s %s",
+                    resp.status_code,
+                    resp.text[:500],
+                )
 
     def _get_file_path(self, file_id: str) -> str | None:
-        url = f"{self._base_url()}/getFile"
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(url, params={"file_id": file_id})
-            if resp.status_code != 200:
-                logger.error("Telegram getFile failed: %s %s", resp.status_code, resp.text[:300])
-                return None
-            data = resp.json()
-            if not data.get("ok"):
-                logger.error("Telegram getFile not ok: %s", data)
-                return None
-            result = data.get("result") or {}
-            file_path = result.get("file_path")
-            if not file_path:
-                logger.error("Telegram getFile missing file_path: %s", result)
-                return None
-            return file_path
+        url = f"{self._base}/getFile"
+        client = self._get_client()
+        resp = client.get(url, params={"file_id": file_id}, timeout=10.0)
+        if resp.status_code != 200:
+            logger.error("Telegram getFile failed: %s %s", resp.status_code, resp.text[:300])
+            return None
+        data = resp.json()
+        if not data.get("ok"):
+            logger.error("Telegram getFile not ok: %s", data)
+            return None
+        result = data.get("result") or {}
+        file_path = result.get("file_path")
+        if not file_path:
+            logger.error("Telegram getFile missing file_path: %s", result)
+            return None
+        return file_path
 
     def download_file(self, file_id: str, dest_dir: str, filename_hint: str | None = None) -> str | None:
         file_path = self._get_file_path(file_id)
@@ -138,15 +151,24 @@ class TelegramAdapter:
             return None
         os.makedirs(dest_dir, exist_ok=True)
         filename = filename_hint or os.path.basename(file_path)
-        dest_path = _unique_path(os.path.join(dest_dir, filename))
-        url = f"https://api.telegram.org/file/bot{self.token}/{file_path}"
-        with httpx.Client(timeout=30.0) as client:
-            resp = client.get(url)
+        url = f"{self._file_base}/{file_path}"
+        client = self._get_client()
+        # Stream straight to disk so large voice/video/document uploads are
+        # never held in memory whole.
+        with client.stream("GET", url, timeout=30.0) as resp:
             if resp.status_code != 200:
+                resp.read()
                 logger.error("Telegram file download failed: %s %s", resp.status_code, resp.text[:300])
                 return None
-            with open(dest_path, "wb") as handle:
-                handle.write(resp.content)
+            dest_path, handle = _open_unique(os.path.join(dest_dir, filename))
+            try:
+                with handle:
+                    for chunk in resp.iter_bytes(65536):
+                        handle.write(chunk)
+            except Exception:
+                # Don't leave a truncated file behind if the stream breaks.
+                os.remove(dest_path)
+                raise
         return dest_path
 
     def delete_webhook(self, drop_pending: bool = True) -> None:
@@ -157,27 +179,27 @@ class TelegramAdapter:
         prevents stale messages from a previous crashed session from
         being replayed on restart.
         """
-        url = f"{self._base_url()}/deleteWebhook"
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.post(url, json={"drop_pending_updates": drop_pending})
-            logger.info("deleteWebhook (drop_pending=%s): %s %s", drop_pending, resp.status_code, resp.text[:200])
+        url = f"{self._base}/deleteWebhook"
+        client = self._get_client()
+        resp = client.post(url, json={"drop_pending_updates": drop_pending}, timeout=10.0)
+        logger.info("deleteWebhook (drop_pending=%s): %s %s", drop_pending, resp.status_code, resp.text[:200])
 
     def get_updates(self, offset: int = 0, timeout: int = 30) -> list[dict[str, Any]]:
         """Long-poll Telegram for updates."""
-        url = f"{self._base_url()}/getUpdates"
+        url = f"{self._base}/getUpdates"
         params = {"timeout": timeout, "allowed_updates": ["message"]}
         if offset:
             params["offset"] = offset  # type: ignore[assignment]
-        with httpx.Client(timeout=timeout + 10) as client:
-            resp = client.get(url, params=params)
-            if resp.status_code != 200:
-                logger.error("getUpdates failed: %s %s", resp.status_code, resp.text[:300])
-                return []
-            data = resp.json()
-            if not data.get("ok"):
-                logger.error("getUpdates not ok: %s", data)
-                return []
-            return data.get("result", [])
+        client = self._get_client()
+        resp = client.get(url, params=params, timeout=timeout + 10)
+        if resp.status_code != 200:
+            logger.error("getUpdates failed: %s %s", resp.status_code, resp.text[:300])
+            return []
+        data = resp.json()
+        if not data.get("ok"):
+            logger.error("getUpdates not ok: %s", data)
+            return []
+        return data.get("result", [])
 
     def start_polling(self, on_update: Callable[[dict[str, Any]], None]) -> None:
         """Start a background thread that polls Telegram for messages."""
@@ -191,6 +213,8 @@ class TelegramAdapter:
                     updates = self.get_updates(offset=offset, timeout=25)
                     for update in updates:
                         update_id = update.get("update_id", 0)
+                        # Telegram drops updates below the offset on the next
+                        # getUpdates, which only runs after this batch is handled.
                         offset = update_id + 1
                         try:
                             on_update(update)
@@ -198,7 +222,7 @@ class TelegramAdapter:
                             logger.error("Error processing Telegram update %s: %s", update_id, exc)
                 except Exception as exc:  # noqa: BLE001
                     logger.error("Telegram polling error: %s", exc)
-                    time.sleep(5)  # back off on errors
+                    self._stop_event.wait(5)  # back off on errors
 
         self._polling_thread = threading.Thread(target=_poll_loop, daemon=True, name="telegram-poller")
         self._polling_thread.start()
@@ -211,3 +235,6 @@ class TelegramAdapter:
 
     def stop(self) -> None:
         self.stop_polling()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
@@ -13,28 +13,28 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import httpx
 
+from copenclaw.integrations._http import make_client
+from copenclaw.integrations._util import split_text
+
 logger = logging.getLogger("copenclaw.whatsapp")
 
 _API_BASE = "https://graph.facebook.com/v21.0"
 _MAX_TEXT_LENGTH = 4096
 _CHUNK_MARGIN = 200
 
-
-def _split_text(text: str, max_len: int) -> list[str]:
-    if len(text) <= max_len:
-        return [text]
-    chunks: list[str] = []
-    start = 0
-    while start < len(text):
-        end = min(start + max_len, len(text))
-        chunks.append(text[start:end])
-        start = end
-    return chunks
+# message type -> (payload key, text field, placeholder when the field is empty)
+_MESSAGE_TEXT_FIELDS: dict[str, tuple[str | None, str | None, str]] = {
+    "text": ("text", "body", ""),
+    "image": ("image", "caption", "[image]"),
+    "document": ("document", "caption", "[document]"),
+    "audio": (None, None, "[audio message]"),
+    "video": ("video", "caption", "[video]"),
+}
 
 
 @dataclass
@@ -42,15 +42,21 @@ class WhatsAppAdapter:
     phone_number_id: str
     access_token: str
     verify_token: str = ""
+    _headers: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _messages_url: str = field(default="", init=False, repr=False)
+    _client: Optional[httpx.Client] = field(default=None, init=False, repr=False)
 
-    def _headers(self) -> dict[str, str]:
-        return {
+    def __post_init__(self) -> None:
+        self._headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
         }
+        self._messages_url = f"{_API_BASE}/{self.phone_number_id}/messages"
 
-    def _messages_url(self) -> str:
-        return f"{_API_BASE}/{self.phone_number_id}/messages"
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = make_client()
+        return self._client
 
     # ── Outbound ──────────────────────────────────────────
 
@@ -59,27 +65,28 @@ class WhatsAppAdapter:
         if not text:
             text = "(empty response)"
         max_len = max(1, _MAX_TEXT_LENGTH - _CHUNK_MARGIN)
-        chunks = _split_text(text, max_len)
-        with httpx.Client(timeout=15.0) as client:
-            for chunk in chunks:
-                payload = {
-                    "messaging_product": "whatsapp",
-                    "to": to,
-                    "type": "text",
-                    "text": {"body": chunk},
-                }
-                resp = client.post(
-                    self._messages_url(),
-                    json=payload,
-                    headers=self._headers(),
+        chunks = split_text(text, max_len)
+        client = self._get_client()
+        for chunk in chunks:
+            payload = {
+                "messaging_product": "whatsapp",
+                "to": to,
+                "type": "text",
+                "text": {"body": chunk},
+            }
+            resp = client.post(
+                self._messages_url,
+                json=payload,
+                headers=self._headers,
+                timeout=15.0,
+            )
+            if resp.status_code not in (200, 201):
+                logger.error(
+                    "WhatsApp sendMessage failed: %s %s",
+                    resp.status_code,
+                    resp.text[:500],
                 )
-                if resp.status_code not in (200, 201):
-                    logger.error(
-                        "WhatsApp sendMessage failed: %s %s",
-                        resp.status_code,
-                        resp.text[:500],
-                    )
-                    return
+                return
 
     def send_image(self, to: str, image_url: str, caption: str | None = None) -> None:
         """Send an image message via URL."""
@@ -91,18 +98,19 @@ class WhatsAppAdapter:
         }
         if caption:
             payload["image"]["caption"] = caption[:1024]
-        with httpx.Client(timeout=30.0) as client:
-            resp = client.post(
-                self._messages_url(),
-                json=payload,
-                headers=self._headers(),
+        client = self._get_client()
+        resp = client.post(
+            self._messages_url,
+            json=payload,
+            headers=self._headers,
+            timeout=30.0,
+        )
+        if resp.status_code not in (200, 201):
+            logger.error(
+                "WhatsApp sendImage failed: %s %s",
+                resp.status_code,
+                resp.text[:500],
             )
-            if resp.status_code not in (200, 201):
-                logger.error(
-                    "WhatsApp sendImage failed: %s %s",
-                    resp.status_code,
-                    resp.text[:500],
-                )
 
     def mark_read(self, message_id: str) -> None:
         """Mark a message as read (sends blue ticks)."""
@@ -112,12 +120,13 @@ class WhatsAppAdapter:
             "message_id": message_id,
         }
         try:
-            with httpx.Client(timeout=5.0) as client:
-                client.post(
-                    self._messages_url(),
-                    json=payload,
-                    headers=self._headers(),
-                )
+            client = self._get_client()
+            client.post(
+                self._messages_url,
+                json=payload,
+                headers=self._headers,
+                timeout=5.0,
+            )
         except Exception as exc:  # noqa: BLE001
             logger.debug("mark_read failed (non-critical): %s", exc)
 
@@ -148,42 +157,36 @@ class WhatsAppAdapter:
         Returns an empty list if no messages are present.
         """
         messages: list[dict[str, Any]] = []
-        for entry in body.get("entry", []):
-            for change in entry.get("changes", []):
-                value = change.get("value", {})
+        append = messages.append
+        for entry in body.get("entry") or ():
+            for change in entry.get("changes") or ():
+                value = change.get("value") or {}
                 if value.get("messaging_product") != "whatsapp":
                     continue
-                for msg in value.get("messages", []):
-                    parsed: dict[str, Any] = {
-                        "sender": msg.get("from", ""),
-                        "message_id": msg.get("id", ""),
-                        "timestamp": msg.get("timestamp", ""),
-                        "text": "",
-                    }
+                for msg in value.get("messages") or ():
                     msg_type = msg.get("type", "")
-                    if msg_type == "text":
-                        parsed["text"] = msg.get("text", {}).get("body", "")
-                    elif msg_type == "image":
-                        caption = msg.get("image", {}).get("caption", "")
-                        parsed["text"] = caption or "[image]"
-                    elif msg_type == "document":
-                        caption = msg.get("document", {}).get("caption", "")
-                        parsed["text"] = caption or "[document]"
-                    elif msg_type == "audio":
-                        parsed["text"] = "[audio message]"
-                    elif msg_type == "video":
-                        caption = msg.get("video", {}).get("caption", "")
-                        parsed["text"] = caption or "[video]"
+                    field_info = _MESSAGE_TEXT_FIELDS.get(msg_type)
+                    if field_info is None:
+                        text = f"[{msg_type}]"
                     else:
-                        parsed["text"] = f"[{msg_type}]"
-                    if parsed["text"]:
-                        messages.append(parsed)
+                        outer, inner, placeholder = field_info
+                        content = msg.get(outer) if outer else None
+                        text = (content.get(inner) if content else "") or placeholder
+                    if text:
+                        append({
+                            "sender": msg.get("from", ""),
+                            "message_id": msg.get("id", ""),
+                            "timestamp": msg.get("timestamp", ""),
+                            "text": text,
+                        })
         return messages
 
-    # ── Lifecycle stubs ──────────────────────────────────
+    # ── Lifecycle ─────────────────────────────────────────
 
     def start(self) -> None:
         return None
 
     def stop(self) -> None:
-        return None
\ No newline at end of file
+        if self._client is not None:
+            self._client.close()
+            self._client = None
@@ -9,13 +9,19 @@ JSON-RPC responses back.
 """
 from __future__ import annotations
 
+import importlib
 import json
 import logging
 import os
+import queue
+import re
+import threading
+import time
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Any, Optional
 
-from copenclaw.core.audit import log_event
+from copenclaw.core.audit import log_event, read_recent_events
 from copenclaw.core.mcp_registry import (
     add_server as registry_add_server,
     get_user_servers_for_merge,
@@ -24,28 +30,54 @@ from copenclaw.core.mcp_registry import (
     run_install_command,
 )
 from copenclaw.core.logging_config import (
-    append_to_file,
+    append_to_file_deferred,
     get_mcp_log_path,
     get_activity_log_path,
     log_mcp_call,
     log_task_event_central,
+    read_tail_lines,
 )
 from copenclaw.core.names import generate_name
 from copenclaw.core.policy import ExecutionPolicy, load_execution_policy
 from copenclaw.core.scheduler import Scheduler
 from copenclaw.core.task_events import TaskEventRegistry
-from copenclaw.core.tasks import TaskManager, _now
+from copenclaw.core.tasks import TERMINAL_TASK_STATUSES, TaskManager, _coarse_now, _now
 from copenclaw.core.worker import WorkerPool
-from copenclaw.integrations.telegram import TelegramAdapter
-from copenclaw.integrations.teams import TeamsAdapter
-from copenclaw.integrations.whatsapp import WhatsAppAdapter
-from copenclaw.integrations.signal import SignalAdapter
-from copenclaw.integrations.slack import SlackAdapter
 
 logger = logging.getLogger("copenclaw.mcp.protocol")
 
-_IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".tif", ".tiff"}
-_CI_DIRECTION_ORDER = ["ux", "reliability", "performance", "quality", "safety", "observability", "docs"]
+# Channel adapters are imported on first use, so loading the protocol
+# module doesn't pull in every integration (and its dependencies) up front.
+_ADAPTER_MODULES = {
+    "TelegramAdapter": "copenclaw.integrations.telegram",
+    "TeamsAdapter": "copenclaw.integrations.teams",
+    "WhatsAppAdapter": "copenclaw.integrations.whatsapp",
+    "SignalAdapter": "copenclaw.integrations.signal",
+    "SlackAdapter": "copenclaw.integrations.slack",
+}
+
+
+def _adapter(name: str) -> Any:
+    """Return the adapter class *name*, importing its module on first use.
+
+    The class is cached as a module global, which is also where
+    ``mock.patch("copenclaw.mcp.protocol.TelegramAdapter")`` puts its stand-in.
+    """
+    cls = globals().get(name)
+    if cls is None:
+        cls = getattr(importlib.import_module(_ADAPTER_MODULES[name]), name)
+        globals()[name] = cls
+    return cls
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ADAPTER_MODULES:
+        return _adapter(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".tif", ".tiff"})
+_CI_DIRECTION_ORDER = ("ux", "reliability", "performance", "quality", "safety", "observability", "docs")
 _CI_DIRECTION_GUIDANCE = {
     "ux": "Improve user-facing flow clarity, ergonomics, and friction points.",
     "reliability": "Increase runtime robustness, error handling, and recovery behavior.",
@@ -55,14 +87,64 @@ _CI_DIRECTION_GUIDANCE = {
     "observability": "Improve logs, metrics, and diagnosis signals for faster debugging.",
     "docs": "Improve operator/developer documentation for maintainability and handoff.",
 }
+_TASK_MSG_EMOJI = {
+    "completed": "✅", "failed": "❌", "needs_input": "❓",
+    "escalation": "⚠️", "progress": "📊", "artifact": "📦",
+    "assessment": "🧪", "intervention": "🧭",
+}
 
 
 def _is_image_path(path: str) -> bool:
-    return os.path.splitext(path.lower())[1] in _IMAGE_EXTENSIONS
+    return os.path.splitext(path)[1].lower() in _IMAGE_EXTENSIONS
+
+
+# Supervisor assessment keywords, matched as plain substrings of the
+# lower-cased summary + detail (so "lacks" and "incomplete" hit too).
+_STRONG_NEGATIVE_RE = re.compile("|".join(map(re.escape, (
+    "truncated", "incomplete", "missing", "error", "failed",
+    "cannot", "lack", "absent", "broken", "wrong",
+))))
+_POSITIVE_RE = re.compile("|".join(map(re.escape, (
+    "verified", "verify", "looks good", "complete", "success",
+    "correct", "passed", "ok", "done", "finished", "created",
+    "built", "working",
+))))
+
+
+def _minutes_seconds(secs: int) -> str:
+    minutes, seconds = divmod(secs, 60)
+    return f"{minutes}m {seconds}s"
+
+
+def _is_within(base: str, target: str) -> bool:
+    # commonpath rather than startswith, so "/data2" is not inside "/data".
+    # Both paths must already be absolute; paths on different drives
+    # (Windows) raise ValueError and are never within *base*.
+    try:
+        return os.path.commonpath([base, target]) == base
+    except ValueError:
+        return False
+
+
+def _truncated_dumps(obj: Any, limit: int) -> str:
+    """Return ``json.dumps(obj, default=str)[:limit]`` without encoding all of *obj*.
+
+    Top-level string values are clipped to *limit* characters first.  A
+    clipped string still encodes to at least *limit* characters, so the
+    first *limit* characters of the output are unchanged — but a large
+    ``text``/``content`` argument no longer gets escaped in full just to
+    be sliced away.
+    """
+    if isinstance(obj, dict):
+        obj = {k: v[:limit] if isinstance(v, str) and len(v) > limit else v for k, v in obj.items()}
+    return json.dumps(obj, default=str)[:limit]
 
 # ── Tool definitions (returned by tools/list) ────────────────────
+#
+# Tuples, not lists: the schema is fixed at import and shared by every
+# handler (and by the cached tools/list payload below).
 
-INFRA_TOOLS = [
+INFRA_TOOLS = (
     {
         "name": "jobs_schedule",
         "description": "Schedule a one-shot or recurring job. The job will execute a prompt via Copilot CLI and deliver the result to a chat channel.",
@@ -198,9 +280,9 @@ INFRA_TOOLS = [
             },
         },
     },
-]
+)
 
-TASK_TOOLS = [
+TASK_TOOLS = (
     # ── Orchestrator-level tools ──
     {
         "name": "tasks_propose",
@@ -394,10 +476,57 @@ TASK_TOOLS = [
             "required": ["task_id", "content"],
         },
     },
-]
+)
 
 ALL_TOOLS = INFRA_TOOLS + TASK_TOOLS
 
+# The tool schema never changes at runtime, so the tools/list result is
+# built and JSON-encoded once at import.  ``encode_response`` splices the
+# cached bytes into the envelope instead of re-walking ~30 schemas on
+# every handshake.
+_TOOLS_LIST_RESULT: dict[str, Any] = {"tools": ALL_TOOLS}
+_TOOLS_LIST_JSON = json.dumps(
+    _TOOLS_LIST_RESULT, ensure_ascii=False, separators=(",", ":"),
+).encode("utf-8")
+
+# Seconds a supervisor has to finalize a deferred completion before the
+# watchdog auto-finalizes it.
+_DEFERRED_COMPLETION_TIMEOUT = 300.0
+
+# Distinct (worker.log, tail) pairs remembered by task_read_peer.
+_LOG_TAIL_CACHE_SIZE = 128
+
+_NO_OP_METHODS = frozenset({"initialized", "notifications/initialized", "ping"})
+
+
+_ENVELOPE_PREFIX = b'{"jsonrpc":"2.0","id":'
+_RESULT_KEY = b',"result":'
+_ERROR_KEY = b',"error":'
+
+
+def _encode_json(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_response(response: dict[str, Any]) -> bytes:
+    """Serialize a ``handle_request`` response to JSON bytes.
+
+    JSON-RPC 2.0 envelopes are assembled from a constant prefix and the
+    separately encoded id and result/error, and a tools/list result reuses
+    the payload encoded at import time.  Anything else (``{}`` for
+    notifications, non-2.0 envelopes) goes through ``json.dumps`` as-is.
+    """
+    if response.get("jsonrpc") != "2.0" or len(response) != 3:
+        return _encode_json(response)
+    if "result" in response:
+        key, value = _RESULT_KEY, response["result"]
+    elif "error" in response:
+        key, value = _ERROR_KEY, response["error"]
+    else:
+        return _encode_json(response)
+    payload = _TOOLS_LIST_JSON if value is _TOOLS_LIST_RESULT else _encode_json(value)
+    return b"".join([_ENVELOPE_PREFIX, _encode_json(response["id"]), key, payload, b"}"])
+
 
 class MCPProtocolHandler:
     """Handles MCP JSON-RPC requests and dispatches tool calls."""
@@ -416,6 +545,9 @@ class MCPProtocolHandler:
     ) -> None:
         self.scheduler = scheduler
         self.data_dir = data_dir
+        # files_read / files_write resolve paths against this on every call.
+        self._data_dir_abs = os.path.abspath(data_dir) if data_dir else None
+        self._activity_log_path = os.path.join(data_dir or os.getenv("copenclaw_DATA_DIR", ".data"), "activity.log")
         self.telegram_token = telegram_token
         self.msteams_creds = msteams_creds
         self.task_manager = task_manager
@@ -424,8 +556,87 @@ class MCPProtocolHandler:
         self.owner_chat_id = owner_chat_id  # Telegram chat ID for the owner, used as fallback
         # Cache execution policy at init time (after dotenv is loaded)
         self._execution_policy = execution_policy or load_execution_policy()
+        # Resolved once: setup_logging() has already run by the time the
+        # gateway builds the handler, and the log dir is fixed thereafter.
+        self._mcp_log_path = get_mcp_log_path()
+        # One channel adapter per class with the credentials it was built
+        # from, reused across sends so it keeps its pooled HTTP client (and,
+        # for Teams, its access token).  Replaced when credentials change.
+        self._adapter_cache: dict[type, tuple[tuple, Any]] = {}
+        self._adapter_cache_lock = threading.Lock()
+        # worker.log tails for task_read_peer, keyed by (path, tail) and
+        # reused while the file's size and mtime are unchanged.
+        self._log_tail_cache: dict[tuple[str, int], tuple[int, int, str]] = {}
+        self._log_tail_lock = threading.Lock()
+        # Task notifications are delivered in order by one background
+        # sender, so task_report returns without waiting on channel HTTP.
+        self._notify_queue: "queue.SimpleQueue[tuple[str, Any] | threading.Event]" = queue.SimpleQueue()
+        self._notify_thread: Optional[threading.Thread] = None
+        self._notify_thread_lock = threading.Lock()
+        # Pending deferred-completion watchdogs, one per task_id
+        self._watchdog_timers: dict[str, threading.Timer] = {}
+        self._watchdog_lock = threading.Lock()
         # Per-task event stream registry
         self.event_registry = TaskEventRegistry()
+        # JSON-RPC method / tool name -> bound handler, so dispatch is a
+        # single dict lookup.  tools/call is routed inline in _dispatch
+        # because it also needs the caller's task_id and role.
+        self._method_dispatch: dict[str, Any] = {
+            "initialize": self._handle_initialize,
+            "initialized": self._handle_noop,
+            "notifications/initialized": self._handle_noop,
+            "tools/list": self._handle_tools_list,
+            "ping": self._handle_noop,
+        }
+        self._tool_dispatch: dict[str, Any] = {
+            # Infrastructure tools
+            "jobs_schedule": self._tool_jobs_schedule,
+            "jobs_list": self._tool_jobs_list,
+            "jobs_cancel": self._tool_jobs_cancel,
+            "jobs_runs": self._tool_jobs_runs,
+            "jobs_clear_all": self._tool_jobs_clear_all,
+            "send_message": self._tool_send_message,
+            "files_read": self._tool_files_read,
+            "files_write": self._tool_files_write,
+            "audit_read": self._tool_audit_read,
+            # MCP server management tools
+            "mcp_server_add": self._tool_mcp_server_add,
+            "mcp_server_list": self._tool_mcp_server_list,
+            "mcp_server_remove": self._tool_mcp_server_remove,
+            # App lifecycle tools
+            "app_restart": self._tool_app_restart,
+            # Task dispatch tools (orchestrator level)
+            "tasks_propose": self._tool_tasks_propose,
+            "tasks_approve": self._tool_tasks_approve,
+            "tasks_create": self._tool_tasks_create,
+            "tasks_list": self._tool_tasks_list,
+            "tasks_status": self._tool_tasks_status,
+            "tasks_logs": self._tool_tasks_logs,
+            "tasks_send": self._tool_tasks_send,
+            "tasks_cancel": self._tool_tasks_cancel,
+            "tasks_clear_all": self._tool_tasks_clear_all,
+            # Task ITC tools (worker/supervisor level)
+            "task_report": self._tool_task_report,
+            "task_check_inbox": self._tool_task_check_inbox,
+            "task_set_status": self._tool_task_set_status,
+            "task_get_context": self._tool_task_get_context,
+            "task_read_peer": self._tool_task_read_peer,
+            "task_send_input": self._tool_task_send_input,
+        }
+        # tasks_logs log_type -> reader; unknown types use the task log.
+        self._log_readers: dict[str, Any] = {
+            "combined": self._read_combined_log,
+            "worker": self._read_session_log,
+            "supervisor": self._read_session_log,
+            "activity": self._read_activity_log,
+        }
+        self._channel_senders: dict[str, Any] = {
+            "telegram": self._send_telegram,
+            "teams": self._send_teams,
+            "whatsapp": self._send_whatsapp,
+            "signal": self._send_signal,
+            "slack": self._send_slack,
+        }
         # Callback fired when a task reaches a terminal state (includes on_complete hook if provided).
         # Signature: on_complete_callback(prompt: str, channel: str, target: str, service_url: str, source_task_name: str) -> None
         self.on_complete_callback: Any = None
@@ -456,19 +667,28 @@ class MCPProtocolHandler:
         params = body.get("params", {})
         req_id = body.get("id")
 
+        # Keep-alives and the initialized notification carry no payload and
+        # arrive often; answer them without any logging work.
+        if method in _NO_OP_METHODS:
+            if req_id is None:
+                return {}
+            return {"jsonrpc": jsonrpc, "id": req_id, "result": {}}
+
         logger.info("MCP request: method=%s id=%s task=%s role=%s", method, req_id, task_id, role)
         # Log every inbound MCP request to the centralized MCP log (plain text)
-        append_to_file(
-            get_mcp_log_path(),
+        append_to_file_deferred(
+            self._mcp_log_path,
             f"REQUEST method={method} id={req_id} task={task_id} role={role}",
         )
-        # Also log structured JSONL for MCP requests
-        log_mcp_call(
-            method=method,
-            params=params,
-            task_id=task_id,
-            role=role,
-        )
+        # Also log structured JSONL for MCP requests.  tools/call gets a
+        # single combined record (args, result, duration) once it finishes.
+        if method != "tools/call":
+            log_mcp_call(
+                method=method,
+                params=params,
+                task_id=task_id,
+                role=role,
+            )
 
         try:
             result = self._dispatch(method, params, task_id=task_id, role=role)
@@ -488,17 +708,12 @@ class MCPProtocolHandler:
         task_id: str | None = None,
         role: str | None = None,
     ) -> Any:
-        if method == "initialize":
-            return self._handle_initialize(params)
-        if method in ("initialized", "notifications/initialized"):
-            return {}
-        if method == "tools/list":
-            return self._handle_tools_list(params, role=role)
         if method == "tools/call":
             return self._handle_tools_call(params, task_id=task_id, role=role)
-        if method == "ping":
-            return {}
-        raise ValueError(f"Unknown method: {method}")
+        handler = self._method_dispatch.get(method)
+        if handler is None:
+            raise ValueError(f"Unknown method: {method}")
+        return handler(params)
 
     def _handle_initialize(self, params: dict[str, Any]) -> dict[str, Any]:
         return {
@@ -507,10 +722,13 @@ class MCPProtocolHandler:
             "serverInfo": {"name": "COpenClaw", "version": "0.2.0"},
         }
 
+    def _handle_noop(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {}
+
     def _handle_tools_list(self, params: dict[str, Any], role: str | None = None) -> dict[str, Any]:
         # All tools visible to all roles — orchestrator uses tasks_create
         # for automated follow-ups (on_complete hooks, scheduled tasks)
-        return {"tools": ALL_TOOLS}
+        return _TOOLS_LIST_RESULT
 
     def _handle_tools_call(
         self,
@@ -520,39 +738,35 @@ class MCPProtocolHandler:
     ) -> dict[str, Any]:
         name = params.get("name", "")
         arguments = params.get("arguments", {})
-        args_str = json.dumps(arguments)[:2000]
-        event_args_summary = json.dumps(arguments, default=str)[:4000]
+        # Encode the arguments once and slice the truncated views from it.
+        args_json = _truncated_dumps(arguments, 4000)
+        args_str = args_json[:2000]
+        event_args_summary = args_json[:4000]
         send_message_summary = ""
         if name == "send_message":
             send_message_summary, _ = self._summarize_send_message_args(arguments)
             event_args_summary = send_message_summary
         logger.info("MCP tools/call: %s args=%s (task=%s role=%s)", name, args_str[:200], task_id, role)
-        # Detailed MCP tool call log
-        append_to_file(
-            get_mcp_log_path(),
-            f"TOOL_CALL tool={name} task={task_id} role={role} args={args_str}",
-        )
 
         # Store caller context so individual tool methods can use it for audit
         self._current_task_id = task_id
         self._current_role = role or "orchestrator"
 
-        import time as _time
-        _t0 = _time.monotonic()
+        _t0 = time.monotonic()
 
         # Track last worker activity timestamp for stuck-detection
         if task_id and role == "worker" and self.task_manager:
             task_obj = self.task_manager.get(task_id)
             if task_obj:
-                task_obj.last_worker_activity_at = _now()
+                task_obj.last_worker_activity_at = _coarse_now()
                 if task_obj.watchdog_state in {"warned", "restarted"}:
                     task_obj.watchdog_state = "none"
                     task_obj.watchdog_last_action_at = None
-                self.task_manager._save()
+                self.task_manager.mark_dirty()
 
         try:
             result = self._call_tool(name, arguments)
-            _duration_ms = (_time.monotonic() - _t0) * 1000
+            _duration_ms = (time.monotonic() - _t0) * 1000
             result_str = json.dumps(result, default=str)
 
             if name == "send_message" and task_id and role == "worker" and self.task_manager:
@@ -561,150 +775,92 @@ class MCPProtocolHandler:
                     summary = send_message_summary or self._summarize_send_message_args(arguments)[0]
                     task.add_timeline("message_sent", f"Sent user message ({summary})")
                     task.updated_at = _now()
-                    self.task_manager._save()
-
-            # Log tool call details — wrapped in its own try/except so
-            # logging failures never turn a successful tool call into an error.
-            try:
-                self._log_task_event(
-                    task_id, role or "unknown", name,
-                    event_args_summary,
-                    result_str[:8000],
-                    is_error=False,
-                )
-                append_to_file(
-                    get_mcp_log_path(),
-                    f"TOOL_RESULT tool={name} task={task_id} ok=true result={result_str[:4000]}",
-                )
-                log_mcp_call(
-                    method="tools/call",
-                    params={"name": name},
-                    result=result,
-                    task_id=task_id,
-                    role=role,
-                    duration_ms=_duration_ms,
-                    tool_name=name,
-                    tool_args=arguments,
-                )
-                log_task_event_central(
-                    task_id=task_id or "",
-                    role=role or "orchestrator",
-                    tool=name,
-                    args_summary=event_args_summary,
-                    result_summary=result_str[:4000],
-                    is_error=False,
-                )
-            except Exception:  # noqa: BLE001
-                logger.warning("Failed to log successful tool call %s (result still returned)", name, exc_info=True)
+                    self.task_manager.mark_dirty()
 
+            self._log_tool_call(
+                name, arguments, task_id, role, event_args_summary, _duration_ms,
+                result=result, result_json=result_str,
+            )
             return {
                 "content": [{"type": "text", "text": result_str}],
                 "isError": False,
             }
         except Exception as exc:  # noqa: BLE001
-            _duration_ms = (_time.monotonic() - _t0) * 1000
+            _duration_ms = (time.monotonic() - _t0) * 1000
             logger.error("Tool %s failed: %s", name, exc)
-            err_str = str(exc)
-            # Log error to per-task event stream
+            self._log_tool_call(
+                name, arguments, task_id, role, event_args_summary, _duration_ms,
+                error=str(exc),
+            )
+            return {
+                "content": [{"type": "text", "text": f"Error: {exc}"}],
+                "isError": True,
+            }
+
+    def _log_tool_call(
+        self,
+        name: str,
+        arguments: dict[str, Any],
+        task_id: str | None,
+        role: str | None,
+        args_summary: str,
+        duration_ms: float,
+        result: Any = None,
+        result_json: str = "",
+        error: str | None = None,
+    ) -> None:
+        """Record a finished tool call in the per-task stream, the MCP call
+        logs (plain-text summary line and JSONL record) and the central
+        task-events log.
+
+        Failures are logged and swallowed here, so neither a successful
+        nor a failed tool call changes outcome because logging broke.
+        """
+        is_error = error is not None
+        summary = error if is_error else result_json
+        try:
             self._log_task_event(
                 task_id, role or "unknown", name,
-                event_args_summary,
-                err_str[:4000],
-                is_error=True,
+                args_summary,
+                summary[:4000] if is_error else summary[:8000],
+                is_error=is_error,
             )
-            # Log tool error to centralized MCP log (plain text)
-            append_to_file(
-                get_mcp_log_path(),
-                f"TOOL_RESULT tool={name} task={task_id} ok=false error={err_str[:4000]}",
+            # One plain-text line per call, so the REQUEST lines in the MCP
+            # log are followed by what was called and how it ended.
+            outcome = f"ok=false error={error[:2000]}" if is_error else f"ok=true result={result_json[:2000]}"
+            append_to_file_deferred(
+                self._mcp_log_path,
+                f"TOOL_RESULT tool={name} task={task_id} role={role} "
+                f"ms={duration_ms:.0f} args={args_summary[:1000]} {outcome}",
             )
-            # Structured JSONL MCP call log with error
             log_mcp_call(
                 method="tools/call",
                 params={"name": name},
-                error=err_str,
+                result=result,
+                error=error,
                 task_id=task_id,
                 role=role,
-                duration_ms=_duration_ms,
+                duration_ms=duration_ms,
                 tool_name=name,
                 tool_args=arguments,
+                result_json=None if is_error else result_json,
             )
-            # Centralized task-events JSONL log (error)
             log_task_event_central(
                 task_id=task_id or "",
                 role=role or "orchestrator",
                 tool=name,
-                args_summary=event_args_summary,
-                result_summary=err_str[:4000],
-                is_error=True,
+                args_summary=args_summary,
+                result_summary=summary[:4000],
+                is_error=is_error,
             )
-            return {
-                "content": [{"type": "text", "text": f"Error: {exc}"}],
-                "isError": True,
-            }
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to log tool call %s (outcome unaffected)", name, exc_info=True)
 
     def _call_tool(self, name: str, args: dict[str, Any]) -> Any:
-        # Infrastructure tools
-        if name == "jobs_schedule":
-            return self._tool_jobs_schedule(args)
-        if name == "jobs_list":
-            return self._tool_jobs_list(args)
-        if name == "jobs_cancel":
-            return self._tool_jobs_cancel(args)
-        if name == "jobs_runs":
-            return self._tool_jobs_runs(args)
-        if name == "jobs_clear_all":
-            return self._tool_jobs_clear_all(args)
-        if name == "send_message":
-            return self._tool_send_message(args)
-        if name == "files_read":
-            return self._tool_files_read(args)
-        if name == "files_write":
-            return self._tool_files_write(args)
-        if name == "audit_read":
-            return self._tool_audit_read(args)
-        # MCP server management tools
-        if name == "mcp_server_add":
-            return self._tool_mcp_server_add(args)
-        if name == "mcp_server_list":
-            return self._tool_mcp_server_list(args)
-        if name == "mcp_server_remove":
-            return self._tool_mcp_server_remove(args)
-        # App lifecycle tools
-        if name == "app_restart":
-            return self._tool_app_restart(args)
-        # Task dispatch tools (orchestrator level)
-        if name == "tasks_propose":
-            return self._tool_tasks_propose(args)
-        if name == "tasks_approve":
-            return self._tool_tasks_approve(args)
-        if name == "tasks_create":
-            return self._tool_tasks_create(args)
-        if name == "tasks_list":
-            return self._tool_tasks_list(args)
-        if name == "tasks_status":
-            return self._tool_tasks_status(args)
-        if name == "tasks_logs":
-            return self._tool_tasks_logs(args)
-        if name == "tasks_send":
-            return self._tool_tasks_send(args)
-        if name == "tasks_cancel":
-            return self._tool_tasks_cancel(args)
-        if name == "tasks_clear_all":
-            return self._tool_tasks_clear_all(args)
-        # Task ITC tools (worker/supervisor level)
-        if name == "task_report":
-            return self._tool_task_report(args)
-        if name == "task_check_inbox":
-            return self._tool_task_check_inbox(args)
-        if name == "task_set_status":
-            return self._tool_task_set_status(args)
-        if name == "task_get_context":
-            return self._tool_task_get_context(args)
-        if name == "task_read_peer":
-            return self._tool_task_read_peer(args)
-        if name == "task_send_input":
-            return self._tool_task_send_input(args)
-        raise ValueError(f"Unknown tool: {name}")
+        handler = self._tool_dispatch.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return handler(args)
 
     # ── Infrastructure tool implementations ───────────────
 
@@ -756,6 +912,79 @@ class MCPProtocolHandler:
             log_event(self.data_dir, "mcp.jobs.clear_all", {"cleared": count})
         return {"status": "cleared", "cleared": count}
 
+    # Channel credentials that only come from the environment.  dotenv has
+    # been loaded before the handler is built, so they are read on first
+    # use and kept for the handler's lifetime (the app restarts to pick
+    # up new settings).
+
+    @cached_property
+    def _whatsapp_creds(self) -> tuple[str | None, str | None]:
+        return os.getenv("WHATSAPP_PHONE_NUMBER_ID"), os.getenv("WHATSAPP_ACCESS_TOKEN")
+
+    @cached_property
+    def _signal_creds(self) -> tuple[str | None, str | None]:
+        return os.getenv("SIGNAL_API_URL"), os.getenv("SIGNAL_PHONE_NUMBER")
+
+    @cached_property
+    def _slack_token(self) -> str | None:
+        return os.getenv("SLACK_BOT_TOKEN")
+
+    def _cached_log_tail(self, path: str, tail: int) -> str:
+        """Return the last *tail* lines of *path* ("" if missing), re-reading only after it changes."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return ""
+        key = (path, tail)
+        with self._log_tail_lock:
+            hit = self._log_tail_cache.get(key)
+        if hit is not None and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+            return hit[2]
+        lines = read_tail_lines(path, tail)
+        text = "".join(lines) if lines else ""
+        with self._log_tail_lock:
+            if key not in self._log_tail_cache and len(self._log_tail_cache) >= _LOG_TAIL_CACHE_SIZE:
+                # Drop the oldest entry (dicts keep insertion order).
+                self._log_tail_cache.pop(next(iter(self._log_tail_cache)))
+            self._log_tail_cache[key] = (st.st_size, st.st_mtime_ns, text)
+        return text
+
+    def _get_adapter(self, name: str, **credentials: Any) -> Any:
+        """Return a shared adapter instance for *name* and these credentials.
+
+        An adapter built from credentials that have since changed is
+        replaced and its HTTP client closed.
+        """
+        cls = _adapter(name)
+        key = tuple(sorted(credentials.items()))
+        stale = None
+        with self._adapter_cache_lock:
+            entry = self._adapter_cache.get(cls)
+            if entry is not None and entry[0] == key:
+                return entry[1]
+            adapter = cls(**credentials)
+            self._adapter_cache[cls] = (key, adapter)
+            if entry is not None:
+                stale = entry[1]
+        if stale is not None:
+            self._stop_adapter(stale)
+        return adapter
+
+    def close_adapters(self) -> None:
+        """Close the HTTP clients of every cached channel adapter."""
+        with self._adapter_cache_lock:
+            adapters = [adapter for _, adapter in self._adapter_cache.values()]
+            self._adapter_cache.clear()
+        for adapter in adapters:
+            self._stop_adapter(adapter)
+
+    @staticmethod
+    def _stop_adapter(adapter: Any) -> None:
+        try:
+            adapter.stop()
+        except Exception:  # noqa: BLE001
+            logger.debug("Failed to stop channel adapter %r", adapter, exc_info=True)
+
     def _audit(self, action: str, payload: dict[str, Any]) -> None:
         """Write an audit log entry with role/task context automatically included."""
         if not self.data_dir:
@@ -793,132 +1022,126 @@ class MCPProtocolHandler:
 
     def _tool_send_message(self, args: dict[str, Any]) -> dict:
         channel = args["channel"]
-        text = args.get("text") or ""
-        image_path = args.get("image_path")
+        sender = self._channel_senders.get(channel)
+        if sender is None:
+            raise ValueError(f"Unsupported channel: {channel}")
         _, audit_payload = self._summarize_send_message_args(args)
-        if channel == "telegram":
-            if not self.telegram_token:
-                raise ValueError("Telegram not configured")
-            adapter = TelegramAdapter(self.telegram_token)
-            if image_path:
-                caption = text or None
-                if caption and len(caption) > 1024:
-                    adapter.send_photo(chat_id=int(args["target"]), photo_path=image_path, caption=caption[:1024])
-                    adapter.send_message(chat_id=int(args["target"]), text=caption)
-                else:
-                    adapter.send_photo(chat_id=int(args["target"]), photo_path=image_path, caption=caption)
-                self._audit("send_message", audit_payload)
-                return {"status": "sent", "channel": "telegram"}
-            adapter.send_message(chat_id=int(args["target"]), text=text)
-            self._audit("send_message", audit_payload)
-            return {"status": "sent", "channel": "telegram"}
-        if channel == "teams":
-            if not self.msteams_creds:
-                raise ValueError(
-                    "Teams not configured. Set MSTEAMS_APP_ID, MSTEAMS_APP_PASSWORD, MSTEAMS_TENANT_ID."
-                )
-            service_url = args.get("service_url") or self.msteams_creds.get("service_url")
-            if not service_url:
-                raise ValueError(
-                    "service_url required for Teams (from webhook payload). "
-                    "Pass service_url or send a Teams message to capture it."
-                )
-            TeamsAdapter(
-                app_id=self.msteams_creds["app_id"],
-                app_password=self.msteams_creds["app_password"],
-                tenant_id=self.msteams_creds["tenant_id"],
-            ).send_message(service_url=service_url, conversation_id=args["target"], text=text)
-            self._audit("send_message", audit_payload)
-            return {"status": "sent", "channel": "teams"}
-        if channel == "whatsapp":
-            wa_phone_id = os.getenv("WHATSAPP_PHONE_NUMBER_ID")
-            wa_token = os.getenv("WHATSAPP_ACCESS_TOKEN")
-            if not wa_phone_id or not wa_token:
-                raise ValueError("WhatsApp not configured")
-            adapter = WhatsAppAdapter(phone_number_id=wa_phone_id, access_token=wa_token)
-            if image_path:
-                adapter.send_image(to=args["target"], image_url=image_path, caption=text or None)
-            else:
-                adapter.send_message(to=args["target"], text=text)
-            self._audit("send_message", audit_payload)
-            return {"status": "sent", "channel": "whatsapp"}
-        if channel == "signal":
-            sig_url = os.getenv("SIGNAL_API_URL")
-            sig_phone = os.getenv("SIGNAL_PHONE_NUMBER")
-            if not sig_url or not sig_phone:
-                raise ValueError(
-                    "Signal not configured. Set SIGNAL_API_URL and SIGNAL_PHONE_NUMBER, "
-                    "and ensure signal-cli-rest-api is running."
-                )
-            adapter = SignalAdapter(api_url=sig_url, phone_number=sig_phone)
-            if image_path:
-                adapter.send_image(recipient=args["target"], image_path=image_path, caption=text or None)
-            else:
-                adapter.send_message(recipient=args["target"], text=text)
-            self._audit("send_message", audit_payload)
-            return {"status": "sent", "channel": "signal"}
-        if channel == "slack":
-            slack_token = os.getenv("SLACK_BOT_TOKEN")
-            if not slack_token:
-                raise ValueError("Slack not configured")
-            adapter = SlackAdapter(bot_token=slack_token)
-            if image_path:
-                adapter.send_image(channel=args["target"], image_path=image_path, caption=text or None)
+        sender(args, args.get("text") or "", args.get("image_path"))
+        self._audit("send_message", audit_payload)
+        return {"status": "sent", "channel": channel}
+
+    def _send_telegram(self, args: dict[str, Any], text: str, image_path: str | None) -> None:
+        if not self.telegram_token:
+            raise ValueError("Telegram not configured")
+        adapter = self._get_adapter("TelegramAdapter", token=self.telegram_token)
+        if image_path:
+            caption = text or None
+            if caption and len(caption) > 1024:
+                adapter.send_photo(chat_id=int(args["target"]), photo_path=image_path, caption=caption[:1024])
+                adapter.send_message(chat_id=int(args["target"]), text=caption)
             else:
-                adapter.send_message(channel=args["target"], text=text)
-            self._audit("send_message", audit_payload)
-            return {"status": "sent", "channel": "slack"}
-        raise ValueError(f"Unsupported channel: {channel}")
+                adapter.send_photo(chat_id=int(args["target"]), photo_path=image_path, caption=caption)
+            return
+        adapter.send_message(chat_id=int(args["target"]), text=text)
+
+    def _send_teams(self, args: dict[str, Any], text: str, image_path: str | None) -> None:
+        if not self.msteams_creds:
+            raise ValueError(
+                "Teams not configured. Set MSTEAMS_APP_ID, MSTEAMS_APP_PASSWORD, MSTEAMS_TENANT_ID."
+            )
+        service_url = args.get("service_url") or self.msteams_creds.get("service_url")
+        if not service_url:
+            raise ValueError(
+                "service_url required for Teams (from webhook payload). "
+                "Pass service_url or send a Teams message to capture it."
+            )
+        self._get_adapter(
+            "TeamsAdapter",
+            app_id=self.msteams_creds["app_id"],
+            app_password=self.msteams_creds["app_password"],
+            tenant_id=self.msteams_creds["tenant_id"],
+        ).send_message(service_url=service_url, conversation_id=args["target"], text=text)
+
+    def _send_whatsapp(self, args: dict[str, Any], text: str, image_path: str | None) -> None:
+        wa_phone_id, wa_token = self._whatsapp_creds
+        if not wa_phone_id or not wa_token:
+            raise ValueError("WhatsApp not configured")
+        adapter = self._get_adapter("WhatsAppAdapter", phone_number_id=wa_phone_id, access_token=wa_token)
+        if image_path:
+            adapter.send_image(to=args["target"], image_url=image_path, caption=text or None)
+        else:
+            adapter.send_message(to=args["target"], text=text)
+
+    def _send_signal(self, args: dict[str, Any], text: str, image_path: str | None) -> None:
+        sig_url, sig_phone = self._signal_creds
+        if not sig_url or not sig_phone:
+            raise ValueError(
+                "Signal not configured. Set SIGNAL_API_URL and SIGNAL_PHONE_NUMBER, "
+                "and ensure signal-cli-rest-api is running."
+            )
+        adapter = self._get_adapter("SignalAdapter", api_url=sig_url, phone_number=sig_phone)
+        if image_path:
+            adapter.send_image(recipient=args["target"], image_path=image_path, caption=text or None)
+        else:
+            adapter.send_message(recipient=args["target"], text=text)
+
+    def _send_slack(self, args: dict[str, Any], text: str, image_path: str | None) -> None:
+        slack_token = self._slack_token
+        if not slack_token:
+            raise ValueError("Slack not configured")
+        adapter = self._get_adapter("SlackAdapter", bot_token=slack_token)
+        if image_path:
+            adapter.send_image(channel=args["target"], image_path=image_path, caption=text or None)
+        else:
+            adapter.send_message(channel=args["target"], text=text)
 
     def _tool_files_read(self, args: dict[str, Any]) -> dict:
         if not self.data_dir:
             raise ValueError("data_dir not configured")
-        base = os.path.abspath(self.data_dir)
+        base = self._data_dir_abs
         path = args["path"]
         if not os.path.isabs(path):
             path = os.path.join(base, path)
         target = os.path.abspath(path)
-        if not target.startswith(base):
+        if not _is_within(base, target):
             raise PermissionError("Path is outside allowed data_dir")
-        if not os.path.exists(target):
-            raise FileNotFoundError(f"File not found: {path}")
-        with open(target, "r", encoding="utf-8") as f:
+        try:
+            f = open(target, "r", encoding="utf-8")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+        with f:
             return {"content": f.read()}
 
     def _tool_files_write(self, args: dict[str, Any]) -> dict:
         """Write content to a file. Relative paths resolve against data_dir."""
         if not self.data_dir:
             raise ValueError("data_dir not configured")
-        base = os.path.abspath(self.data_dir)
+        base = self._data_dir_abs
         path = args["path"]
         if not os.path.isabs(path):
             path = os.path.join(base, path)
         target = os.path.abspath(path)
         # Warn (but allow) writes outside data_dir to preserve backward compatibility.
-        if not target.startswith(base):
+        if not _is_within(base, target):
             logger.warning("files_write: path outside data_dir: %s", target)
-        # Create parent directories
-        parent = os.path.dirname(target)
-        if parent:
-            os.makedirs(parent, exist_ok=True)
-        with open(target, "w", encoding="utf-8") as f:
-            f.write(args["content"])
-        self._audit("files.write", {"path": target, "size": len(args["content"])})
-        return {"status": "written", "path": target, "size": len(args["content"])}
+        # Encode once and write bytes: no text-layer encoder or newline
+        # translation, and the reported size is the on-disk byte count.
+        data = args["content"].encode("utf-8")
+        # Create parent directories only when the first open says they're missing.
+        try:
+            f = open(target, "wb")
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            f = open(target, "wb")
+        with f:
+            f.write(data)
+        self._audit("files.write", {"path": target, "size": len(data)})
+        return {"status": "written", "path": target, "size": len(data)}
 
     def _tool_audit_read(self, args: dict[str, Any]) -> dict:
         if not self.data_dir:
             raise ValueError("data_dir not configured")
-        path = os.path.join(self.data_dir, "audit.jsonl")
-        if not os.path.exists(path):
-            return {"events": []}
-        events: list[dict] = []
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    events.append(json.loads(line))
-        return {"events": events[-args.get("limit", 100):]}
+        return {"events": read_recent_events(self.data_dir, args.get("limit", 100))}
 
     def _tool_mcp_server_add(self, args: dict[str, Any]) -> dict:
         """Add an MCP server to Copilot CLI's config."""
@@ -1012,7 +1235,6 @@ class MCPProtocolHandler:
             raise ValueError("Restart not available — no restart callback configured")
 
         # Fire the restart on a short delay so the MCP response can be sent first
-        import threading
         threading.Thread(
             target=self.restart_callback,
             args=(reason,),
@@ -1055,14 +1277,12 @@ class MCPProtocolHandler:
         name = args.get("name") or generate_name()
 
         # Guard: reject duplicate task names that are still active/proposed
-        existing = tm.list_tasks()
-        active_statuses = {"proposed", "running", "paused", "needs_input", "pending", "needs_retry"}
-        for t in existing:
-            if t.name == name and t.status in active_statuses:
-                raise ValueError(
-                    f"A task named '{name}' already exists with status '{t.status}' "
-                    f"(task_id={t.task_id}). Cancel it first or choose a different name."
-                )
+        t = tm.find_open_by_name(name)
+        if t is not None:
+            raise ValueError(
+                f"A task named '{name}' already exists with status '{t.status}' "
+                f"(task_id={t.task_id}). Cancel it first or choose a different name."
+            )
 
         task = tm.create_task(
             name=name,
@@ -1082,19 +1302,19 @@ class MCPProtocolHandler:
         # Set on_complete hook if provided
         if args.get("on_complete"):
             task.on_complete = args["on_complete"]
-            tm._save()
+            tm.mark_dirty()
 
         if self.data_dir:
             log_event(self.data_dir, "task.proposed", {
                 "task_id": task.task_id,
                 "name": task.name,
                 "prompt": task.prompt,
-                "plan": getattr(task, "plan", None),
+                "plan": task.plan,
                 "auto_supervise": task.auto_supervise,
-                "supervisor_instructions": getattr(task, "supervisor_instructions", None),
-                "channel": getattr(task, "channel", ""),
-                "target": getattr(task, "target", ""),
-                "task_type": getattr(task, "task_type", "standard"),
+                "supervisor_instructions": task.supervisor_instructions,
+                "channel": task.channel,
+                "target": task.target,
+                "task_type": task.task_type,
             })
 
         # NOTE: We do NOT send a notification here.  The orchestrator's own
@@ -1147,7 +1367,7 @@ class MCPProtocolHandler:
         # Set on_complete hook if provided
         if args.get("on_complete"):
             task.on_complete = args["on_complete"]
-            tm._save()
+            tm.mark_dirty()
 
         if self.data_dir:
             log_event(self.data_dir, "task.created", {
@@ -1155,10 +1375,10 @@ class MCPProtocolHandler:
                 "name": task.name,
                 "prompt": task.prompt,
                 "auto_supervise": task.auto_supervise,
-                "channel": getattr(task, "channel", ""),
-                "target": getattr(task, "target", ""),
-                "check_interval": getattr(task, "check_interval", None),
-                "task_type": getattr(task, "task_type", "standard"),
+                "channel": task.channel,
+                "target": task.target,
+                "check_interval": task.check_interval,
+                "task_type": task.task_type,
             })
 
         return self._start_task(task)
@@ -1180,11 +1400,11 @@ class MCPProtocolHandler:
                     if w.session_id:
                         t.worker_session_id = w.session_id
                     t.worker_pid = w.pid
-                    tm._save()
+                    tm.mark_dirty()
                     if w.session_id:
                         logger.info("Stored worker session %s on task %s for future resume", w.session_id, task_id)
 
-            if t and t.status not in ("completed", "failed", "cancelled"):
+            if t and t.status not in TERMINAL_TASK_STATUSES:
                 if output.startswith("ERROR:") or output.startswith("UNEXPECTED ERROR:"):
                     self._request_retry_approval(task_id, output[:500])
                 else:
@@ -1194,17 +1414,16 @@ class MCPProtocolHandler:
                     t.worker_process_observed_at = _now()
                     t.worker_child_pids = []
                     t.worker_process_running = False
-                    tm._save()
+                    tm.mark_dirty()
 
                     # If supervisor is still running but worker exited, check for
                     # unread inbox messages and re-dispatch if supervisor sent feedback
                     if t.auto_supervise and pool:
                         sup = pool.get_supervisor(task_id)
-                        unread = [m for m in t.inbox if not m.acknowledged]
-                        if sup and sup.is_running and unread:
+                        if sup and sup.is_running and t.unread_count:
                             logger.info(
                                 "Worker %s exited but supervisor is active with %d unread messages — re-dispatching",
-                                task_id, len(unread),
+                                task_id, t.unread_count,
                             )
                             try:
                                 pool.start_worker(
@@ -1225,18 +1444,17 @@ class MCPProtocolHandler:
                     # WATCHDOG: If worker exited and completion was deferred,
                     # schedule a timeout to auto-finalize if supervisor doesn't act
                     if t.completion_deferred and t.auto_supervise:
-                        import threading
 
                         def _deferred_completion_watchdog(tid: str, deferred_at_iso: str) -> None:
                             """Auto-finalize a deferred completion if supervisor hasn't acted within 5 minutes."""
-                            import time as _wtime
-                            _wtime.sleep(300)  # 5 minute timeout
+                            with self._watchdog_lock:
+                                self._watchdog_timers.pop(tid, None)
                             _t = tm.get(tid)
                             if not _t:
                                 return
                             if not _t.completion_deferred:
                                 return  # supervisor already finalized
-                            if _t.status in ("completed", "failed", "cancelled"):
+                            if _t.status in TERMINAL_TASK_STATUSES:
                                 return  # already terminal
                             # Check if deferred_at is still the same (wasn't reset)
                             if _t.completion_deferred_at and _t.completion_deferred_at.isoformat() == deferred_at_iso:
@@ -1274,12 +1492,21 @@ class MCPProtocolHandler:
                                 )
 
                         deferred_at_str = t.completion_deferred_at.isoformat() if t.completion_deferred_at else ""
-                        threading.Thread(
-                            target=_deferred_completion_watchdog,
+                        timer = threading.Timer(
+                            _DEFERRED_COMPLETION_TIMEOUT,
+                            _deferred_completion_watchdog,
                             args=(task_id, deferred_at_str),
-                            daemon=True,
-                            name=f"watchdog-{task_id[:8]}",
-                        ).start()
+                        )
+                        timer.daemon = True
+                        timer.name = f"watchdog-{task_id[:8]}"
+                        # One pending watchdog per task: a re-armed deferral
+                        # replaces the earlier timer instead of stacking.
+                        with self._watchdog_lock:
+                            previous = self._watchdog_timers.pop(task_id, None)
+                            self._watchdog_timers[task_id] = timer
+                        if previous is not None:
+                            previous.cancel()
+                        timer.start()
                         logger.info("Started deferred-completion watchdog for task %s (5 min timeout)", task_id)
 
         return on_worker_output, on_worker_complete
@@ -1294,7 +1521,7 @@ class MCPProtocolHandler:
                 task.worker_process_running = False
                 task.worker_process_observed_at = _now()
                 task.updated_at = _now()
-                tm._save()
+                tm.mark_dirty()
             return {"pid": task.worker_pid, "child_pids": list(task.worker_child_pids), "running": False, "active_pids": []}
 
         snapshot = worker.process_snapshot() if hasattr(worker, "process_snapshot") else {}
@@ -1317,7 +1544,7 @@ class MCPProtocolHandler:
             task.worker_process_running = bool(running)
             task.worker_process_observed_at = observed_at
             task.updated_at = _now()
-            tm._save()
+            tm.mark_dirty()
 
         return {
             "pid": pid,
@@ -1332,13 +1559,13 @@ class MCPProtocolHandler:
         pool = self._require_worker_pool()
 
         on_worker_output, on_worker_complete = self._build_worker_callbacks(tm, pool)
-        if getattr(task, "task_type", "standard") == "continuous_improvement":
+        if task.task_type == "continuous_improvement":
             tm.mark_continuous_started(task.task_id)
             task = tm.get(task.task_id) or task
 
         # Start worker
         tm.update_status(task.task_id, "running")
-        worker_prompt = tm.build_continuous_prompt(task) if getattr(task, "task_type", "standard") == "continuous_improvement" else task.prompt
+        worker_prompt = tm.build_continuous_prompt(task) if task.task_type == "continuous_improvement" else task.prompt
         pool.start_worker(
             task_id=task.task_id,
             prompt=worker_prompt,
@@ -1365,7 +1592,7 @@ class MCPProtocolHandler:
                 worker_session_id=None,
                 check_interval=task.check_interval,
                 on_output=on_supervisor_output,
-                supervisor_instructions=getattr(task, "supervisor_instructions", ""),
+                supervisor_instructions=task.supervisor_instructions,
                 working_dir=task.working_dir,
                 task_manager=tm,
             )
@@ -1373,12 +1600,12 @@ class MCPProtocolHandler:
 
         # Schedule continuous-improvement ticks (if applicable). If no scheduler
         # is configured, log a warning so operators know ticks will not run.
-        if getattr(task, "task_type", "standard") == "continuous_improvement":
+        if task.task_type == "continuous_improvement":
             if getattr(self, "scheduler", None) is None:
                 logger.warning(
                     "Continuous improvement task %s started without a scheduler; "
                     "continuous tick mechanism will not run.",
-                    getattr(task, "task_id", "<unknown>"),
+                    task.task_id,
                 )
             self._schedule_continuous_ticks(task)
 
@@ -1389,7 +1616,7 @@ class MCPProtocolHandler:
             "working_dir": task.working_dir,
             "auto_supervise": task.auto_supervise,
             "check_interval": task.check_interval,
-            "task_type": getattr(task, "task_type", "standard"),
+            "task_type": task.task_type,
         }
 
     def _request_retry_approval(self, task_id: str, reason: str) -> None:
@@ -1438,13 +1665,8 @@ class MCPProtocolHandler:
             # No filter: return all active/proposed tasks + most recent 10
             # completed/failed/cancelled tasks so the orchestrator can
             # reference recently-finished work.
-            all_tasks = tm.list_tasks()
-            active_statuses = {"proposed", "running", "paused", "needs_input", "pending", "needs_retry"}
-            active = [t for t in all_tasks if t.status in active_statuses]
-            terminal = [t for t in all_tasks if t.status not in active_statuses]
-            # Sort terminal by updated_at descending, take top 10
-            terminal.sort(key=lambda t: t.updated_at, reverse=True)
-            tasks = active + terminal[:10]
+            active, recent_terminal = tm.open_and_recent_tasks(10)
+            tasks = active + recent_terminal
 
         return {
             "tasks": [
@@ -1452,11 +1674,11 @@ class MCPProtocolHandler:
                     "task_id": t.task_id,
                     "name": t.name,
                     "status": t.status,
-                    "task_type": getattr(t, "task_type", "standard"),
-                    "created_at": t.created_at.isoformat(),
-                    "updated_at": t.updated_at.isoformat(),
+                    "task_type": t.task_type,
+                    "created_at": t.created_iso,
+                    "updated_at": t.updated_iso,
                     "auto_supervise": t.auto_supervise,
-                    "latest_timeline": t.timeline[-1].summary if t.timeline else "",
+                    "latest_timeline": t.latest_summary,
                 }
                 for t in tasks
             ]
@@ -1474,19 +1696,19 @@ class MCPProtocolHandler:
             "name": task.name,
             "prompt": task.prompt,
             "status": task.status,
-            "task_type": getattr(task, "task_type", "standard"),
-            "created_at": task.created_at.isoformat(),
-            "updated_at": task.updated_at.isoformat(),
+            "task_type": task.task_type,
+            "created_at": task.created_iso,
+            "updated_at": task.updated_iso,
             "completed_at": task.completed_at.isoformat() if task.completed_at else None,
             "worker_session_id": task.worker_session_id,
             "supervisor_session_id": task.supervisor_session_id,
             "timeline": task.concise_timeline(limit),
-            "pending_inbox": len([m for m in task.inbox if not m.acknowledged]),
+            "pending_inbox": task.unread_count,
             "worker_pid": process_state.get("pid"),
             "worker_child_processes": len(process_state.get("child_pids", [])),
             "worker_process_running": bool(process_state.get("running")),
         }
-        if getattr(task, "task_type", "standard") == "continuous_improvement":
+        if task.task_type == "continuous_improvement":
             result["continuous"] = tm.continuous_status(task)
         return result
 
@@ -1495,53 +1717,58 @@ class MCPProtocolHandler:
         task_id = args["task_id"]
         tail = args.get("tail", 100)
         log_type = args.get("log_type", "combined")
+        reader = self._log_readers.get(log_type, self._read_task_log)
+        logs = reader(tm, task_id, tail, log_type)
+        return {"task_id": task_id, "log_type": log_type, "logs": logs}
 
-        if log_type == "combined":
-            # Default: read from TaskManager's log (populated by on_output callbacks)
-            logs = tm.read_log(task_id, tail=tail)
-            # Fall back to worker.log if raw.log is empty/missing
-            if not logs or logs == "(no logs)":
-                task = tm.get(task_id)
-                if task:
-                    worker_log = os.path.join(task.working_dir, "worker.log")
-                    if os.path.exists(worker_log):
-                        with open(worker_log, "r", encoding="utf-8") as f:
-                            all_lines = f.readlines()
-                        if all_lines:
-                            logs = "".join(all_lines[-tail:])
-            # Fall back to event stream if still empty
-            if not logs or logs == "(no logs)":
-                event_log = self.event_registry.get(task_id)
-                if event_log and event_log.count() > 0:
-                    logs = event_log.formatted_tail(tail)
-        elif log_type in ("worker", "supervisor"):
-            # Read from the per-task log file written by WorkerThread/SupervisorThread
+    def _read_task_log(self, tm: TaskManager, task_id: str, tail: int, log_type: str) -> str:
+        return tm.read_log(task_id, tail=tail)
+
+    def _read_combined_log(self, tm: TaskManager, task_id: str, tail: int, log_type: str) -> str:
+        # Default: read from TaskManager's log (populated by on_output callbacks)
+        logs = tm.tail_log(task_id, tail=tail)
+        # Fall back to worker.log if raw.log is empty/missing
+        if not logs:
             task = tm.get(task_id)
-            if not task:
-                raise ValueError(f"Task not found: {task_id}")
-            log_file = os.path.join(task.working_dir, f"{log_type}.log")
-            if os.path.exists(log_file):
-                with open(log_file, "r", encoding="utf-8") as f:
-                    all_lines = f.readlines()
-                logs = "".join(all_lines[-tail:])
-            else:
-                logs = f"(no {log_type}.log file yet)"
-        elif log_type == "activity":
-            # Read from the unified activity log
-            data_dir = self.data_dir or os.getenv("copenclaw_DATA_DIR", ".data")
-            activity_path = os.path.join(data_dir, "activity.log")
-            if os.path.exists(activity_path):
-                with open(activity_path, "r", encoding="utf-8") as f:
-                    all_lines = f.readlines()
-                # Filter to this task_id if possible
-                task_lines = [l for l in all_lines if task_id[:12] in l]
-                logs = "".join(task_lines[-tail:]) if task_lines else "".join(all_lines[-tail:])
-            else:
-                logs = "(no activity.log file yet)"
-        else:
-            logs = tm.read_log(task_id, tail=tail)
+            if task:
+                tail_lines = read_tail_lines(os.path.join(task.working_dir, "worker.log"), tail)
+                if tail_lines:
+                    logs = "".join(tail_lines)
+        # Fall back to event stream if still empty
+        if not logs:
+            event_log = self.event_registry.get(task_id)
+            if event_log and event_log.count() > 0:
+                logs = event_log.formatted_tail(tail)
+        return "(no logs)" if logs is None else logs
+
+    def _read_session_log(self, tm: TaskManager, task_id: str, tail: int, log_type: str) -> str:
+        # Read from the per-task log file written by WorkerThread/SupervisorThread
+        task = tm.get(task_id)
+        if not task:
+            raise ValueError(f"Task not found: {task_id}")
+        tail_lines = read_tail_lines(os.path.join(task.working_dir, f"{log_type}.log"), tail)
+        if tail_lines is None:
+            return f"(no {log_type}.log file yet)"
+        return "".join(tail_lines)
 
-        return {"task_id": task_id, "log_type": log_type, "logs": logs}
+    def _read_activity_log(self, tm: TaskManager, task_id: str, tail: int, log_type: str) -> str:
+        # Read from the unified activity log
+        try:
+            f = open(self._activity_log_path, "rb")
+        except FileNotFoundError:
+            return "(no activity.log file yet)"
+        with f:
+            all_lines = f.read().splitlines(keepends=True)
+        # Filter to this task_id if possible.  Matching raw bytes
+        # means only the lines that are returned get decoded.
+        needle = task_id[:12].encode("utf-8")
+        task_lines = [l for l in all_lines if needle in l] or all_lines
+        return (
+            b"".join(task_lines[-tail:])
+            .decode("utf-8", errors="replace")
+            .replace("\r\n", "\n")
+            .replace("\r", "\n")
+        )
 
     def _tool_tasks_send(self, args: dict[str, Any]) -> dict:
         tm = self._require_task_manager()
@@ -1555,8 +1782,7 @@ class MCPProtocolHandler:
 
         # Auto-resume: if task is in a terminal state and the message is an
         # instruction or redirect, re-dispatch a worker with the new instructions.
-        terminal_states = {"completed", "failed", "cancelled"}
-        if task.status in terminal_states and msg_type in ("instruction", "redirect"):
+        if task.status in TERMINAL_TASK_STATUSES and msg_type in ("instruction", "redirect"):
             pool = self._require_worker_pool()
 
             # Update supervisor_instructions if provided
@@ -1658,7 +1884,7 @@ class MCPProtocolHandler:
         task_id = args["task_id"]
         report_type = args["type"]
         task_for_report = tm.get(task_id)
-        is_continuous = bool(task_for_report and getattr(task_for_report, "task_type", "standard") == "continuous_improvement")
+        is_continuous = bool(task_for_report and task_for_report.task_type == "continuous_improvement")
         from_tier = args.get("from_tier")
         if not from_tier:
             from_tier = self._current_role if self._current_role in ("worker", "supervisor") else "worker"
@@ -1675,15 +1901,8 @@ class MCPProtocolHandler:
                 combined = f"{summary_text} {detail_text}".lower()
                 # Only treat as negative if strong failure signals are present
                 # Words like "not yet verified" or "pending" alone should NOT block
-                strong_negative = any(k in combined for k in [
-                    "truncated", "incomplete", "missing", "error", "failed",
-                    "cannot", "lack", "lacks", "absent", "broken", "wrong",
-                ])
-                positive = any(k in combined for k in [
-                    "verified", "verify", "looks good", "complete", "completed",
-                    "success", "correct", "passed", "ok", "done", "finished",
-                    "created", "built", "working",
-                ])
+                strong_negative = _STRONG_NEGATIVE_RE.search(combined) is not None
+                positive = _POSITIVE_RE.search(combined) is not None
                 process_state = self._sync_worker_process_state(tm, task_id)
                 worker_running = bool(process_state.get("running"))
                 can_complete = task.completion_deferred or not worker_running
@@ -1724,7 +1943,7 @@ class MCPProtocolHandler:
         # If a WORKER reports "completed" and there's an active supervisor,
         # defer completion — let the supervisor verify the outcome first
         if report_type == "completed" and from_tier == "worker":
-            task = tm.get(task_id)
+            task = task_for_report
             if task and task.auto_supervise and self.worker_pool:
                 sup = self.worker_pool.get_supervisor(task_id)
                 if sup and sup.is_running:
@@ -1783,16 +2002,18 @@ class MCPProtocolHandler:
             raise ValueError(f"Task not found: {task_id}")
         effective_report_type = msg.msg_type
 
+        # handle_report() found the task, so the lookup at the top was not
+        # None; the same Task object is updated in place.
+        task = task_for_report
+
         # If task is terminal, stop worker/supervisor threads
         if effective_report_type in ("completed", "failed") and self.worker_pool:
             self.worker_pool.stop_task(task_id)
-            task = tm.get(task_id)
             if task:
                 self._cancel_supervisor_job(task)
 
         # Fire on_complete hook if task just reached a terminal state
         if effective_report_type in ("completed", "failed"):
-            task = tm.get(task_id)
             if task:
                 reason = "COMPLETED successfully" if effective_report_type == "completed" else f"FAILED — {args.get('summary', 'unknown error')[:300]}"
                 self._fire_on_complete_hook(task, reason, args.get("summary", ""), args.get("detail", ""))
@@ -1813,7 +2034,7 @@ class MCPProtocolHandler:
         task_id = args["task_id"]
         # If task is in a terminal state, tell the caller to exit
         task = tm.get(task_id)
-        if task and task.status in ("completed", "failed", "cancelled"):
+        if task and task.status in TERMINAL_TASK_STATUSES:
             return {
                 "messages": [
                     {"msg_id": "system", "type": "terminate", "from": "system",
@@ -1889,8 +2110,8 @@ class MCPProtocolHandler:
             if age_secs < 60:
                 last_activity_str = f"{age_secs}s ago"
             else:
-                last_activity_str = f"{age_secs // 60}m {age_secs % 60}s ago"
-            stall_threshold = max(int(getattr(task, "check_interval", 600)) * 3, 900)
+                last_activity_str = f"{_minutes_seconds(age_secs)} ago"
+            stall_threshold = max(int(task.check_interval) * 3, 900)
             if age_secs > stall_threshold and worker_running and not child_pids:
                 last_activity_str += " — MAY BE STUCK"
 
@@ -1902,7 +2123,7 @@ class MCPProtocolHandler:
             if exit_secs < 60:
                 worker_exit_str = f"exited {exit_secs}s ago"
             else:
-                worker_exit_str = f"exited {exit_secs // 60}m {exit_secs % 60}s ago"
+                worker_exit_str = f"exited {_minutes_seconds(exit_secs)} ago"
 
         # Deferred completion info
         deferred_str = "NO"
@@ -1912,19 +2133,29 @@ class MCPProtocolHandler:
             if task.completion_deferred_at:
                 d_age = now - task.completion_deferred_at
                 d_secs = int(d_age.total_seconds())
-                deferred_str += f" (deferred {d_secs // 60}m {d_secs % 60}s ago)"
+                deferred_str += f" (deferred {_minutes_seconds(d_secs)} ago)"
             deferred_summary = task.completion_deferred_summary or ""
 
         # Task age
         task_age = now - task.created_at
         task_age_secs = int(task_age.total_seconds())
-        task_age_str = f"{task_age_secs // 60}m {task_age_secs % 60}s"
+        task_age_str = _minutes_seconds(task_age_secs)
 
         # Unread inbox
-        unread_count = len([m for m in task.inbox if not m.acknowledged])
+        unread_count = task.unread_count
 
-        # Build status block
-        status_lines = [
+        # Action-required warning, if any
+        warning = ""
+        if task.completion_deferred and not worker_running:
+            warning = (
+                "⚠️ ACTION REQUIRED: Worker has exited and completion is deferred. "
+                "You MUST make a final pass/fail decision NOW. Report type='completed' or type='failed'."
+            )
+        elif not worker_running and task.status == "running":
+            warning = "⚠️ WARNING: Worker process has exited but task is still marked as running."
+
+        # Build status block; optional lines are empty strings and dropped
+        status_block = "\n".join(filter(None, (
             "=== Worker Status ===",
             f"Process: {worker_state}" + (f" — {worker_exit_str}" if worker_exit_str and not worker_running else ""),
             f"Worker PID: {worker_pid if worker_pid else 'unknown'}",
@@ -1932,27 +2163,12 @@ class MCPProtocolHandler:
             f"Active process count: {len(active_pids)}",
             f"Last MCP activity: {last_activity_str}",
             f"Completion deferred: {deferred_str}",
-        ]
-        if deferred_summary:
-            status_lines.append(f'  Worker said: "{deferred_summary[:200]}"')
-        status_lines.extend([
+            deferred_summary and f'  Worker said: "{deferred_summary[:200]}"',
             f"Supervisor assessments so far: {task.supervisor_assessment_count} (none finalized the task)" if task.supervisor_assessment_count > 0 else f"Supervisor assessments so far: 0",
             f"Unread inbox messages: {unread_count}",
             f"Task running for: {task_age_str}",
-        ])
-
-        # Add action-required warnings
-        if task.completion_deferred and not worker_running:
-            status_lines.append(
-                "⚠️ ACTION REQUIRED: Worker has exited and completion is deferred. "
-                "You MUST make a final pass/fail decision NOW. Report type='completed' or type='failed'."
-            )
-        elif not worker_running and task.status == "running":
-            status_lines.append(
-                "⚠️ WARNING: Worker process has exited but task is still marked as running."
-            )
-
-        status_block = "\n".join(status_lines)
+            warning,
+        )))
 
         # PRIMARY: Read from per-task event stream (captures MCP tool calls)
         event_log = self.event_registry.get(task_id)
@@ -1962,13 +2178,7 @@ class MCPProtocolHandler:
             events_text = "(no MCP events yet)"
 
         # SECONDARY: Also include worker.log (stdout) if it has content
-        worker_log_path = os.path.join(task.working_dir, "worker.log")
-        stdout_text = ""
-        if os.path.exists(worker_log_path):
-            with open(worker_log_path, "r", encoding="utf-8") as f:
-                all_lines = f.readlines()
-            if all_lines:
-                stdout_text = "".join(all_lines[-tail:])
+        stdout_text = self._cached_log_tail(os.path.join(task.working_dir, "worker.log"), tail)
 
         # Combine into a readable summary — status block FIRST
         sections = [status_block]
@@ -2068,7 +2278,7 @@ class MCPProtocolHandler:
         detail: str = "",
     ) -> dict[str, Any] | None:
         tm = self._require_task_manager()
-        if getattr(task, "task_type", "standard") != "continuous_improvement":
+        if task.task_type != "continuous_improvement":
             return None
 
         tm._ensure_continuous_defaults(task)
@@ -2270,7 +2480,7 @@ class MCPProtocolHandler:
             return
 
         chain_info: dict[str, Any] | None = None
-        if getattr(task, "task_type", "standard") == "continuous_improvement":
+        if task.task_type == "continuous_improvement":
             try:
                 chain_info = self._maybe_chain_continuous_task(task, reason, summary, detail)
             except Exception as exc:  # noqa: BLE001
@@ -2279,7 +2489,6 @@ class MCPProtocolHandler:
         if not self.on_complete_callback:
             return
         try:
-            import threading
             hook_instruction = (task.on_complete or "").strip()
             summary_text = summary.strip() or "(no summary provided)"
             detail_text = detail.strip()
@@ -2347,22 +2556,21 @@ class MCPProtocolHandler:
         )
         task.supervisor_job_id = job.job_id
         task.updated_at = _now()
-        tm = self._require_task_manager()
-        tm._save()
+        self._require_task_manager().mark_dirty()
 
     def _schedule_continuous_ticks(self, task: Any) -> None:
         if not self.scheduler:
             return
-        if getattr(task, "task_type", "standard") != "continuous_improvement":
+        if task.task_type != "continuous_improvement":
             return
         interval = 60
-        ci_config = getattr(task, "ci_config", {}) or {}
+        ci_config = task.ci_config or {}
         if isinstance(ci_config, dict):
             try:
                 interval = max(10, int(ci_config.get("min_iteration_interval_seconds", 60)))
             except Exception:  # noqa: BLE001
                 interval = 60
-        if getattr(task, "ci_tick_job_id", ""):
+        if task.ci_tick_job_id:
             self.scheduler.cancel(task.ci_tick_job_id)
         payload = {
             "type": "continuous_tick",
@@ -2376,21 +2584,27 @@ class MCPProtocolHandler:
         )
         task.ci_tick_job_id = job.job_id
         task.updated_at = _now()
-        self._require_task_manager()._save()
+        self._require_task_manager().mark_dirty()
 
     def _cancel_supervisor_job(self, task: Any) -> None:
+        with self._watchdog_lock:
+            watchdog = self._watchdog_timers.pop(task.task_id, None)
+        if watchdog is not None:
+            watchdog.cancel()
         if not self.scheduler:
             return
+        if not task.supervisor_job_id and not task.ci_tick_job_id:
+            return
         if task.supervisor_job_id:
             self.scheduler.cancel(task.supervisor_job_id)
             task.supervisor_job_id = ""
-            task.updated_at = _now()
-        if getattr(task, "ci_tick_job_id", ""):
+        if task.ci_tick_job_id:
             self.scheduler.cancel(task.ci_tick_job_id)
             task.ci_tick_job_id = ""
-            task.updated_at = _now()
-        tm = self._require_task_manager()
-        tm._save()
+        task.updated_at = _now()
+        # Job ids only; the scheduler persists the cancellation itself.
+        # Coalesces with the caller's own save (e.g. tasks_clear_all).
+        self._require_task_manager().mark_dirty()
 
     # ── Notification helpers ──────────────────────────────
 
@@ -2401,31 +2615,65 @@ class MCPProtocolHandler:
             return
         try:
             if channel == "telegram" and self.telegram_token:
-                TelegramAdapter(self.telegram_token).send_message(chat_id=int(target), text=text)
+                self._get_adapter("TelegramAdapter", token=self.telegram_token).send_message(chat_id=int(target), text=text)
             elif channel == "teams" and self.msteams_creds and service_url:
-                TeamsAdapter(
+                self._get_adapter(
+                    "TeamsAdapter",
                     app_id=self.msteams_creds["app_id"],
                     app_password=self.msteams_creds["app_password"],
                     tenant_id=self.msteams_creds["tenant_id"],
                 ).send_message(service_url=service_url, conversation_id=target, text=text)
             elif channel == "whatsapp":
-                wa_phone_id = os.getenv("WHATSAPP_PHONE_NUMBER_ID")
-                wa_token = os.getenv("WHATSAPP_ACCESS_TOKEN")
+                wa_phone_id, wa_token = self._whatsapp_creds
                 if wa_phone_id and wa_token:
-                    WhatsAppAdapter(phone_number_id=wa_phone_id, access_token=wa_token).send_message(to=target, text=text)
+                    self._get_adapter("WhatsAppAdapter", phone_number_id=wa_phone_id, access_token=wa_token).send_message(to=target, text=text)
             elif channel == "signal":
-                sig_url = os.getenv("SIGNAL_API_URL")
-                sig_phone = os.getenv("SIGNAL_PHONE_NUMBER")
+                sig_url, sig_phone = self._signal_creds
                 if sig_url and sig_phone:
-                    SignalAdapter(api_url=sig_url, phone_number=sig_phone).send_message(recipient=target, text=text)
+                    self._get_adapter("SignalAdapter", api_url=sig_url, phone_number=sig_phone).send_message(recipient=target, text=text)
             elif channel == "slack":
-                slack_token = os.getenv("SLACK_BOT_TOKEN")
+                slack_token = self._slack_token
                 if slack_token:
-                    SlackAdapter(bot_token=slack_token).send_message(channel=target, text=text)
+                    self._get_adapter("SlackAdapter", bot_token=slack_token).send_message(channel=target, text=text)
         except Exception as exc:  # noqa: BLE001
             logger.error("Failed to send notification: %s", exc)
 
     def _notify_user_about_task(self, task_id: str, msg: Any) -> None:
+        """Queue a notification to the user about a task event."""
+        self._notify_queue.put((task_id, msg))
+        if self._notify_thread is None:
+            self._start_notifier()
+
+    def flush_notifications(self, timeout: float = 5.0) -> None:
+        """Block until every task notification queued so far has been sent."""
+        if self._notify_thread is None:
+            return
+        done = threading.Event()
+        self._notify_queue.put(done)
+        done.wait(timeout)
+
+    def _start_notifier(self) -> None:
+        with self._notify_thread_lock:
+            if self._notify_thread is not None:
+                return
+            self._notify_thread = threading.Thread(
+                target=self._notifier_loop, daemon=True, name="task-notifier",
+            )
+            self._notify_thread.start()
+
+    def _notifier_loop(self) -> None:
+        while True:
+            item = self._notify_queue.get()
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                self._deliver_task_notification(*item)
+            except Exception:  # noqa: BLE001
+                # One bad notification must not stop the only sender thread.
+                logger.exception("Failed to deliver notification for task %s", item[0])
+
+    def _deliver_task_notification(self, task_id: str, msg: Any) -> None:
         """Send a notification to the user about a task event."""
         if not self.task_manager:
             return
@@ -2433,12 +2681,7 @@ class MCPProtocolHandler:
         if not task or not task.channel or not task.target:
             return
 
-        emoji_map = {
-            "completed": "✅", "failed": "❌", "needs_input": "❓",
-            "escalation": "⚠️", "progress": "📊", "artifact": "📦",
-            "assessment": "🧪", "intervention": "🧭",
-        }
-        emoji = emoji_map.get(msg.msg_type, "ℹ️")
+        emoji = _TASK_MSG_EMOJI.get(msg.msg_type, "ℹ️")
         text = f"{emoji} **Task '{task.name}'** [{msg.msg_type}]\n{msg.content}"
         if msg.detail:
             text += f"\n\n{msg.detail}"
@@ -2449,7 +2692,7 @@ class MCPProtocolHandler:
 
         try:
             if task.channel == "telegram" and self.telegram_token:
-                tg_adapter = TelegramAdapter(self.telegram_token)
+                tg_adapter = self._get_adapter("TelegramAdapter", token=self.telegram_token)
                 if image_file:
                     caption = text or None
                     if caption and len(caption) > 1024:
@@ -2460,30 +2703,29 @@ class MCPProtocolHandler:
                 else:
                     tg_adapter.send_message(chat_id=int(task.target), text=text)
             elif task.channel == "teams" and self.msteams_creds and task.service_url:
-                TeamsAdapter(
+                self._get_adapter(
+                    "TeamsAdapter",
                     app_id=self.msteams_creds["app_id"],
                     app_password=self.msteams_creds["app_password"],
                     tenant_id=self.msteams_creds["tenant_id"],
                 ).send_message(service_url=task.service_url, conversation_id=task.target, text=text)
             elif task.channel == "whatsapp":
-                wa_phone_id = os.getenv("WHATSAPP_PHONE_NUMBER_ID")
-                wa_token = os.getenv("WHATSAPP_ACCESS_TOKEN")
+                wa_phone_id, wa_token = self._whatsapp_creds
                 if wa_phone_id and wa_token:
-                    wa = WhatsAppAdapter(phone_number_id=wa_phone_id, access_token=wa_token)
+                    wa = self._get_adapter("WhatsAppAdapter", phone_number_id=wa_phone_id, access_token=wa_token)
                     wa.send_message(to=task.target, text=text)
             elif task.channel == "signal":
-                sig_url = os.getenv("SIGNAL_API_URL")
-                sig_phone = os.getenv("SIGNAL_PHONE_NUMBER")
+                sig_url, sig_phone = self._signal_creds
                 if sig_url and sig_phone:
-                    sig = SignalAdapter(api_url=sig_url, phone_number=sig_phone)
+                    sig = self._get_adapter("SignalAdapter", api_url=sig_url, phone_number=sig_phone)
                     if image_file:
                         sig.send_image(recipient=task.target, image_path=artifact_url, caption=text)
                     else:
                         sig.send_message(recipient=task.target, text=text)
             elif task.channel == "slack":
-                slack_token = os.getenv("SLACK_BOT_TOKEN")
+                slack_token = self._slack_token
                 if slack_token:
-                    sl = SlackAdapter(bot_token=slack_token)
+                    sl = self._get_adapter("SlackAdapter", bot_token=slack_token)
                     if image_file:
                         sl.send_image(channel=task.target, image_path=artifact_url, caption=text)
                     else:
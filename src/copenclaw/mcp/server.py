@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 from datetime import datetime
+import hmac
 from typing import Any
 
 from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic import BaseModel, Field
 
-import json
 import os
 
-from copenclaw.core.audit import log_event
+from copenclaw.core.audit import log_event, read_recent_events
 from copenclaw.core.scheduler import Scheduler
 from copenclaw.integrations.telegram import TelegramAdapter
 from copenclaw.integrations.teams import TeamsAdapter
@@ -62,16 +62,20 @@ def get_router(
     msteams_creds: dict | None = None,
     mcp_token: str | None = None,
 ) -> APIRouter:
+    expected_token = mcp_token.encode("utf-8") if mcp_token else b""
+
     def _auth(x_mcp_token: str | None = Header(default=None), authorization: str | None = Header(default=None)) -> None:
-        if not mcp_token:
+        if not expected_token:
             return
         token = x_mcp_token
-        if not token and authorization and authorization.lower().startswith("bearer "):
-            token = authorization.split(" ", 1)[1]
-        if token != mcp_token:
+        if not token and authorization and authorization[:7].lower() == "bearer ":
+            token = authorization[7:]
+        # Bytes so non-ASCII header values compare instead of raising.
+        if not hmac.compare_digest((token or "").encode("utf-8"), expected_token):
             raise HTTPException(status_code=401, detail="Invalid MCP token")
 
     router = APIRouter(dependencies=[Depends(_auth)])
+    data_dir_real = os.path.realpath(data_dir) if data_dir else ""
 
     # ---------- routes ----------
 
@@ -153,16 +157,24 @@ def get_router(
     def files_read(req: ReadFileRequest) -> ReadFileResponse:
         if not data_dir:
             raise HTTPException(status_code=400, detail="data_dir not configured")
-        base = os.path.abspath(data_dir)
+        base = data_dir_real
         path = req.path
         if not os.path.isabs(path):
             path = os.path.join(base, path)
-        target = os.path.abspath(path)
-        if not target.startswith(base):
+        # realpath so a symlink under data_dir cannot point outside it;
+        # commonpath so "/data2" does not pass as inside "/data".
+        target = os.path.realpath(path)
+        try:
+            inside = os.path.commonpath([base, target]) == base
+        except ValueError:
+            inside = False
+        if not inside:
             raise HTTPException(status_code=403, detail="path is outside allowed data_dir")
-        if not os.path.exists(target):
-            raise HTTPException(status_code=404, detail="file not found")
-        with open(target, "r", encoding="utf-8") as handle:
+        try:
+            handle = open(target, "r", encoding="utf-8")
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="file not found") from None
+        with handle:
             content = handle.read()
         return ReadFileResponse(content=content)
 
@@ -170,17 +182,7 @@ def get_router(
     def audit_read(limit: int = 100) -> AuditResponse:
         if not data_dir:
             raise HTTPException(status_code=400, detail="data_dir not configured")
-        path = os.path.join(data_dir, "audit.jsonl")
-        if not os.path.exists(path):
-            return AuditResponse(events=[])
-        events: list[dict[str, Any]] = []
-        with open(path, "r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                events.append(json.loads(line))
-        return AuditResponse(events=events[-limit:])
+        return AuditResponse(events=read_recent_events(data_dir, limit))
 
     @router.post("/send", response_model=dict)
     def send_message(req: SendRequest) -> dict[str, str]:
@@ -36,4 +36,28 @@ def test_log_event_appends() -> None:
         path = os.path.join(tmpdir, "audit.jsonl")
         with open(path, "r") as f:
             lines = [l.strip() for l in f if l.strip()]
-        assert len(lines) == 2
\ No newline at end of file
+        assert len(lines) == 2
+
+
+def test_log_event_recreates_removed_data_dir() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = os.path.join(tmpdir, "data")
+        log_event(data_dir, "a", {})
+        os.remove(os.path.join(data_dir, "audit.jsonl"))
+        os.rmdir(data_dir)
+        log_event(data_dir, "b", {})
+        with open(os.path.join(data_dir, "audit.jsonl"), "r") as f:
+            assert json.loads(f.readline())["type"] == "b"
+
+
+def test_read_recent_events_returns_tail_in_order(monkeypatch) -> None:
+    from copenclaw.core import audit, logging_config
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert audit.read_recent_events(tmpdir, 5) == []
+        for i in range(30):
+            log_event(tmpdir, f"e{i}", {"i": i})
+        monkeypatch.setattr(logging_config, "_TAIL_BLOCK", 64)  # force several backward reads
+        events = audit.read_recent_events(tmpdir, 4)
+        assert [e["type"] for e in events] == ["e26", "e27", "e28", "e29"]
+        assert len(audit.read_recent_events(tmpdir, 100)) == 30
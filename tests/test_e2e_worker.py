@@ -649,6 +649,23 @@ class TestE2ETaskFlow:
         import json
         return json.loads(content)
 
+    def test_activity_logs_filtered_to_task(self, tmp_path):
+        data_dir = str(tmp_path / "data")
+        os.makedirs(data_dir)
+        handler = self._make_handler(data_dir)
+        task_id = "task-abcdef123456789"
+        with open(os.path.join(data_dir, "activity.log"), "wb") as f:
+            f.write(
+                b"09:00 other task-zzzzzzzzzzzz line\r\n"
+                b"09:01 " + task_id.encode() + b" caf\xc3\xa9\r\n"
+                b"09:02 " + task_id.encode() + b" done\n"
+            )
+
+        logs = self._call_tool(handler, "tasks_logs", {"task_id": task_id, "log_type": "activity", "tail": 1})
+        assert logs["logs"] == f"09:02 {task_id} done\n"
+        logs = self._call_tool(handler, "tasks_logs", {"task_id": task_id, "log_type": "activity"})
+        assert logs["logs"] == f"09:01 {task_id} café\n09:02 {task_id} done\n"
+
     def test_completion_hook_fires_without_on_complete(self, tmp_path):
         data_dir = str(tmp_path / "data")
         os.makedirs(data_dir)
@@ -790,6 +807,7 @@ class TestE2ETaskFlow:
         elapsed = time.monotonic() - start
         assert elapsed < 120
 
+        handler.flush_notifications()
         mock_telegram.return_value.send_message.assert_called()
         sent_args = mock_telegram.return_value.send_message.call_args.kwargs
         assert sent_args.get("chat_id") == 999
@@ -899,6 +917,7 @@ class TestE2ETaskFlow:
         assert task.completed_at is not None
 
         # Step 7: Verify Telegram notifications were sent
+        handler.flush_notifications()
         mock_telegram.return_value.send_message.assert_called()
         # Collect all Telegram send_message calls
         all_calls = mock_telegram.return_value.send_message.call_args_list
@@ -1659,6 +1678,32 @@ class TestFilesWrite:
         assert result["status"] == "written"
         assert os.path.exists(os.path.join(data_dir, "deep", "nested", "dir", "file.py"))
 
+    def test_write_reports_size_in_bytes(self, tmp_path):
+        """files_write reports the UTF-8 byte count, not the character count."""
+        data_dir = str(tmp_path / "data")
+        os.makedirs(data_dir)
+        handler = self._make_handler(data_dir)
+
+        result = self._call_tool(handler, "files_write", {"path": "u.txt", "content": "héllo\n"})
+        assert result["size"] == 7
+        with open(os.path.join(data_dir, "u.txt"), "rb") as f:
+            assert f.read() == "héllo\n".encode("utf-8")
+
+    def test_read_rejects_sibling_with_shared_prefix(self, tmp_path):
+        """files_read must not treat data2/ as inside data/."""
+        data_dir = str(tmp_path / "data")
+        os.makedirs(data_dir)
+        sibling = tmp_path / "data2"
+        sibling.mkdir()
+        (sibling / "secret.txt").write_text("nope")
+        handler = self._make_handler(data_dir)
+
+        response = handler.handle_request(
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+             "params": {"name": "files_read", "arguments": {"path": str(sibling / "secret.txt")}}},
+        )
+        assert response["result"]["isError"] is True
+
     def test_files_write_listed_in_tools(self, tmp_path):
         """files_write should appear in tools/list."""
         data_dir = str(tmp_path / "data")
@@ -56,4 +56,31 @@ def test_mcp_tools() -> None:
     tools = response.json()["result"]["tools"]
     names = [t["name"] for t in tools]
     assert "jobs_schedule" in names
-    assert "jobs_cancel" in names
\ No newline at end of file
+    assert "jobs_cancel" in names
+
+
+def test_encode_response_matches_json_dumps() -> None:
+    import json
+
+    from copenclaw.mcp.protocol import _TOOLS_LIST_RESULT, encode_response
+
+    responses = [
+        {},
+        {"jsonrpc": "2.0", "id": 1, "result": {"text": "héllo"}},
+        {"jsonrpc": "2.0", "id": "abc", "error": {"code": -32603, "message": "boom"}},
+        {"jsonrpc": "2.0", "id": 7, "result": _TOOLS_LIST_RESULT},
+        {"jsonrpc": "1.0", "id": 1, "result": None},
+    ]
+    for response in responses:
+        assert json.loads(encode_response(response)) == json.loads(json.dumps(response))
+
+
+def test_mcp_token_auth(monkeypatch) -> None:
+    monkeypatch.setenv("copenclaw_MCP_TOKEN", "s3cret")
+    client = TestClient(create_app())
+    body = {"jsonrpc": "2.0", "id": 1, "method": "ping", "params": {}}
+    assert client.post("/mcp", json=body).status_code == 401
+    assert client.post("/mcp", json=body, headers={"x-mcp-token": "wrong"}).status_code == 401
+    assert client.post("/mcp", json=body, headers={"x-mcp-token": "s3cret"}).status_code == 200
+    assert client.post("/mcp", json=body, headers={"Authorization": "Bearer s3cret"}).status_code == 200
+    assert client.post("/mcp", json=body, headers={"Authorization": "bearer s3cretx"}).status_code == 401
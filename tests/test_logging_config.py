@@ -0,0 +1,58 @@
+import json
+import logging
+
+from copenclaw.core import logging_config
+from copenclaw.core.logging_config import (
+    append_to_file_deferred,
+    flush_deferred_appends,
+    log_mcp_call,
+    mcp_call_logger,
+    read_tail_lines,
+)
+
+
+def test_deferred_appends_are_written_in_order(tmp_path) -> None:
+    path = tmp_path / "nested" / "mcp.log"
+    for i in range(200):
+        append_to_file_deferred(str(path), f"line {i}")
+    flush_deferred_appends()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [line.split(" ", 1)[1] for line in lines] == [f"line {i}" for i in range(200)]
+
+
+def test_log_mcp_call_splices_encoded_result() -> None:
+    class _Capture(logging.Handler):
+        def __init__(self) -> None:
+            super().__init__()
+            self.lines: list[str] = []
+
+        def emit(self, record: logging.LogRecord) -> None:
+            self.lines.append(record.getMessage())
+
+    capture = _Capture()
+    previous_level = mcp_call_logger.level
+    mcp_call_logger.setLevel(logging.INFO)
+    mcp_call_logger.addHandler(capture)
+    try:
+        result = {"status": "ok", "items": [1, "two"]}
+        log_mcp_call("tools/call", {}, result=result, result_json=json.dumps(result), tool_name="x")
+        log_mcp_call("tools/call", {}, error="boom", tool_name="x")
+    finally:
+        mcp_call_logger.removeHandler(capture)
+        mcp_call_logger.setLevel(previous_level)
+
+    ok, failed = (json.loads(line) for line in capture.lines)
+    assert ok["result"] == result
+    assert failed["error"] == "boom" and "result" not in failed
+
+
+def test_read_tail_lines_matches_readlines(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(logging_config, "_TAIL_BLOCK", 16)
+    path = tmp_path / "worker.log"
+    path.write_bytes("".join(f"línea {i}\r\n" for i in range(50)).encode("utf-8") + b"no newline")
+    with open(path, "r", encoding="utf-8") as f:
+        expected = f.readlines()
+    for tail in (0, 1, 3, 50, 51, 200):
+        assert read_tail_lines(str(path), tail) == expected[-tail:]
+    assert read_tail_lines(str(tmp_path / "missing.log"), 10) is None
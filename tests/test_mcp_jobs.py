@@ -147,3 +147,143 @@ def test_clear_all_jobs() -> None:
     # Verify list is empty
     after = json.loads(_tool_call(client, "jobs_list", {})["text"])
     assert len(after["jobs"]) == 0
+
+
+def test_every_listed_tool_is_dispatchable() -> None:
+    from copenclaw.core.scheduler import Scheduler
+    from copenclaw.mcp.protocol import ALL_TOOLS, MCPProtocolHandler
+
+    handler = MCPProtocolHandler(scheduler=Scheduler())
+    assert {t["name"] for t in ALL_TOOLS} == set(handler._tool_dispatch)
+
+
+def test_truncated_dumps_matches_full_encode_prefix() -> None:
+    from copenclaw.mcp.protocol import _truncated_dumps
+
+    args = {"path": "notes.md", "content": 'line "one"\n' * 2000, "mode": "w", "tags": ["a", "b"]}
+    for limit in (5, 200, 4000):
+        assert _truncated_dumps(args, limit) == json.dumps(args, default=str)[:limit]
+
+
+def test_channel_env_cached_per_handler(monkeypatch) -> None:
+    from copenclaw.core.scheduler import Scheduler
+    from copenclaw.mcp.protocol import MCPProtocolHandler
+
+    monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-one")
+    handler = MCPProtocolHandler(scheduler=Scheduler())
+    assert handler._slack_token == "xoxb-one"
+    monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-two")
+    assert handler._slack_token == "xoxb-one"
+    assert MCPProtocolHandler(scheduler=Scheduler())._slack_token == "xoxb-two"
+
+
+def test_cached_log_tail_rereads_after_append(tmp_path) -> None:
+    from copenclaw.core.scheduler import Scheduler
+    from copenclaw.mcp.protocol import MCPProtocolHandler
+
+    handler = MCPProtocolHandler(scheduler=Scheduler())
+    log = tmp_path / "worker.log"
+    assert handler._cached_log_tail(str(log), 2) == ""
+    log.write_text("a\nb\nc\n", encoding="utf-8")
+    assert handler._cached_log_tail(str(log), 2) == "b\nc\n"
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("d\n")
+    assert handler._cached_log_tail(str(log), 2) == "c\nd\n"
+
+
+def test_task_notifications_delivered_in_order(monkeypatch) -> None:
+    from copenclaw.core.scheduler import Scheduler
+    from copenclaw.mcp.protocol import MCPProtocolHandler
+
+    handler = MCPProtocolHandler(scheduler=Scheduler())
+    sent: list[tuple[str, str]] = []
+    monkeypatch.setattr(handler, "_deliver_task_notification", lambda task_id, msg: sent.append((task_id, msg)))
+    for msg in ("progress", "completed"):
+        handler._notify_user_about_task("t1", msg)
+    handler.flush_notifications()
+    assert sent == [("t1", "progress"), ("t1", "completed")]
+
+
+def test_tool_call_writes_result_line_to_mcp_log(tmp_path) -> None:
+    from copenclaw.core.logging_config import flush_deferred_appends
+    from copenclaw.core.scheduler import Scheduler
+    from copenclaw.mcp.protocol import MCPProtocolHandler
+
+    handler = MCPProtocolHandler(scheduler=Scheduler())
+    handler._mcp_log_path = str(tmp_path / "mcp.log")
+    handler.handle_request({
+        "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+        "params": {"name": "jobs_list", "arguments": {}},
+    })
+    flush_deferred_appends()
+    lines = (tmp_path / "mcp.log").read_text(encoding="utf-8").splitlines()
+    assert "REQUEST method=tools/call" in lines[0]
+    assert "TOOL_RESULT tool=jobs_list" in lines[1]
+    assert "ok=true" in lines[1]
+
+
+def test_failed_task_notification_does_not_stop_later_ones(monkeypatch) -> None:
+    from copenclaw.core.scheduler import Scheduler
+    from copenclaw.mcp.protocol import MCPProtocolHandler
+
+    handler = MCPProtocolHandler(scheduler=Scheduler())
+    sent: list[str] = []
+
+    def deliver(task_id: str, msg: str) -> None:
+        if msg == "boom":
+            raise AttributeError("msg_type")
+        sent.append(msg)
+
+    monkeypatch.setattr(handler, "_deliver_task_notification", deliver)
+    for msg in ("first", "boom", "last"):
+        handler._notify_user_about_task("t1", msg)
+    handler.flush_notifications(timeout=2.0)
+    assert sent == ["first", "last"]
+    assert handler._notify_thread.is_alive()
+
+
+def test_adapter_replaced_and_closed_when_credentials_change(monkeypatch) -> None:
+    from copenclaw.core.scheduler import Scheduler
+    from copenclaw.mcp import protocol
+
+    class FakeAdapter:
+        def __init__(self, token: str) -> None:
+            self.token = token
+            self.stopped = False
+
+        def stop(self) -> None:
+            self.stopped = True
+
+    monkeypatch.setattr(protocol, "_adapter", lambda name: FakeAdapter)
+    handler = protocol.MCPProtocolHandler(scheduler=Scheduler())
+    first = handler._get_adapter("FakeAdapter", token="one")
+    assert handler._get_adapter("FakeAdapter", token="one") is first
+    second = handler._get_adapter("FakeAdapter", token="two")
+    assert second is not first and first.stopped and not second.stopped
+    handler.close_adapters()
+    assert second.stopped
+
+
+def test_teams_access_token_reused_until_near_expiry(monkeypatch) -> None:
+    import httpx
+
+    from copenclaw.integrations import teams
+
+    token_requests = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if "login.microsoftonline.com" in request.url.host:
+            token_requests.append(request)
+            return httpx.Response(200, json={"access_token": f"tok{len(token_requests)}", "expires_in": 3600})
+        return httpx.Response(200, json={})
+
+    adapter = teams.TeamsAdapter(app_id="a", app_password="p", tenant_id="t")
+    adapter._client = httpx.Client(transport=httpx.MockTransport(respond))
+    clock = [1000.0]
+    monkeypatch.setattr(teams.time, "monotonic", lambda: clock[0])
+    assert adapter._get_access_token() == "tok1"
+    clock[0] += 3000
+    assert adapter._get_access_token() == "tok1"
+    clock[0] += 400  # inside the refresh margin
+    assert adapter._get_access_token() == "tok2"
+    assert len(token_requests) == 2
@@ -86,6 +86,17 @@ class TestTaskEventLog:
         log.append("worker", "files_read", "README.md", "/home")
         assert log.count() == 2
 
+    def test_reopen_seeds_tail_and_count_from_file(self, tmp_path):
+        log = TaskEventLog(str(tmp_path), task_id="task-abc")
+        for i in range(TaskEventLog.RECENT_EVENTS + 5):
+            log.append("worker", f"tool_{i}", "a", "r")
+
+        reopened = TaskEventLog(str(tmp_path), task_id="task-abc")
+        assert reopened.count() == TaskEventLog.RECENT_EVENTS + 5
+        assert reopened.tail(1)[0].tool == f"tool_{TaskEventLog.RECENT_EVENTS + 4}"
+        # Deeper than the in-memory window falls back to the file
+        assert len(reopened.tail(TaskEventLog.RECENT_EVENTS + 5)) == TaskEventLog.RECENT_EVENTS + 5
+
     def test_empty_tail(self, tmp_path):
         log = TaskEventLog(str(tmp_path), task_id="task-abc")
         assert log.tail() == []
@@ -72,6 +72,16 @@ class TestTaskCreation:
         assert loaded.name == "Persist"
         assert loaded.prompt == "Check persistence"
 
+    def test_mark_dirty_defers_until_flush(self, data_dir):
+        tm1 = TaskManager(data_dir=data_dir)
+        task = tm1.create_task(name="Dirty", prompt="p")
+        task.name = "Renamed"
+        tm1.mark_dirty()
+        assert TaskManager(data_dir=data_dir).get(task.task_id).name == "Dirty"
+
+        tm1.flush()
+        assert TaskManager(data_dir=data_dir).get(task.task_id).name == "Renamed"
+
     def test_unique_task_ids(self, tm):
         t1 = tm.create_task(name="A", prompt="a")
         t2 = tm.create_task(name="B", prompt="b")
@@ -114,6 +124,31 @@ class TestTaskListing:
     def test_get_nonexistent(self, tm):
         assert tm.get("task-doesnotexist") is None
 
+    def test_open_and_recent_tasks(self, tm):
+        live = tm.create_task(name="live", prompt="x")
+        closed = [tm.create_task(name=f"done-{i}", prompt="x") for i in range(4)]
+        for i, t in enumerate(closed):
+            tm.update_status(t.task_id, "completed")
+            t.updated_at = datetime(2024, 1, 1 + i, tzinfo=timezone.utc)
+        open_tasks, recent = tm.open_and_recent_tasks(2)
+        assert [t.task_id for t in open_tasks] == [live.task_id]
+        assert [t.task_id for t in recent] == [closed[3].task_id, closed[2].task_id]
+
+    def test_iso_timestamps_follow_reassignment(self, tm):
+        task = tm.create_task(name="A", prompt="a")
+        assert task.updated_iso == task.updated_at.isoformat()
+        task.updated_at = datetime(2024, 5, 1, tzinfo=timezone.utc)
+        assert task.updated_iso == "2024-05-01T00:00:00+00:00"
+        assert task.to_dict()["created_at"] == task.created_at.isoformat()
+
+    def test_find_open_by_name(self, tm, data_dir):
+        done = tm.create_task(name="A", prompt="a")
+        tm.update_status(done.task_id, "completed")
+        assert tm.find_open_by_name("A") is None
+        live = tm.create_task(name="A", prompt="a2")
+        assert tm.find_open_by_name("A").task_id == live.task_id
+        assert TaskManager(data_dir=data_dir).find_open_by_name("A").task_id == live.task_id
+
 
 # ── Status management ────────────────────────────────────────
 
@@ -290,6 +325,36 @@ class TestDownwardMessages:
         updated = tm.get(task.task_id)
         assert len(updated.inbox) == 2
 
+    def test_unread_count_tracks_inbox(self, tm):
+        task = tm.create_task(name="A", prompt="a")
+        assert task.unread_count == 0
+        tm.send_message(task.task_id, "instruction", "Do X")
+        tm.send_message(task.task_id, "instruction", "Do Y")
+        assert task.unread_count == 2
+        assert len(tm.check_inbox(task.task_id)) == 2
+        assert task.unread_count == 0
+        tm.send_message(task.task_id, "instruction", "Do Z")
+        assert task.unread_count == 1
+
+    def test_check_inbox_concurrent_with_send(self, tm, monkeypatch):
+        import threading
+
+        monkeypatch.setattr(tm, "_save", lambda: None)
+        task = tm.create_task(name="A", prompt="a")
+        received = []
+
+        def send():
+            for i in range(300):
+                tm.send_message(task.task_id, "instruction", f"m{i}")
+
+        sender = threading.Thread(target=send)
+        sender.start()
+        while sender.is_alive():
+            received.extend(tm.check_inbox(task.task_id))
+        received.extend(tm.check_inbox(task.task_id))
+        assert len(received) == 300
+        assert task.unread_count == 0
+
     def test_outbox_includes_downward(self, tm):
         task = tm.create_task(name="A", prompt="a")
         tm.send_message(task.task_id, "instruction", "Do X")
@@ -357,6 +422,11 @@ class TestLogs:
     def test_read_log_unknown_task(self, tm):
         assert tm.read_log("task-nope") == "(no logs)"
 
+    def test_tail_log_returns_none_without_file(self, tm):
+        task = tm.create_task(name="A", prompt="a")
+        assert tm.tail_log(task.task_id) is None
+        assert tm.tail_log("task-nope") is None
+
 
 # ── Notification logic ───────────────────────────────────────
 
@@ -410,6 +480,15 @@ class TestTimeline:
         lines = timeline.strip().split("\n")
         assert len(lines) == 5
 
+    def test_concise_timeline_refreshes_after_append(self, tm):
+        task = tm.create_task(name="A", prompt="a")
+        tm.handle_report(task.task_id, "progress", "Step 1")
+        first = task.concise_timeline(limit=5)
+        assert task.concise_timeline(limit=5) is first
+        tm.handle_report(task.task_id, "progress", "Step 2")
+        assert "Step 2" in task.concise_timeline(limit=5)
+        assert "Step 1" not in task.concise_timeline(limit=1)
+
     def test_empty_timeline(self):
         task = Task(task_id="t1", name="X", prompt="x")
         task.timeline = []